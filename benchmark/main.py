@@ -0,0 +1,70 @@
+from argparse import ArgumentParser, Namespace
+import json
+import sys
+
+from engine.headless import enable_headless
+
+enable_headless()
+
+from engine.screen import set_global_screen
+from engine.levels.manager import LevelsManager
+from engine.main_game_class import Game
+from game.scenes import ScenesManager
+from game.scenes.keys import SceneKey
+from game.assets.images import ICON_IMAGE
+from game.config import GameConfig
+from benchmark.runner import LevelsBenchmark
+
+_DEFAULT_FRAMES_COUNT: int = 600
+
+
+def main() -> None:
+    args: Namespace = _parse_args()
+
+    set_global_screen(
+        h=GameConfig.WINDOW_HEIGHT,
+        title=GameConfig.WINDOW_TITLE,
+        flags=GameConfig.WINDOW_FLAGS,
+        icon=ICON_IMAGE.get(),
+    )
+    scenes_manager: ScenesManager = ScenesManager(
+        initial_scene_key=SceneKey.HOME,
+        # Без файла прогресса прохождение уровней остаётся в памяти.
+        levels_manager=LevelsManager(
+            levels_folder_path=GameConfig.LEVELS_PATH,
+            compiled_levels_folder_path=GameConfig.COMPILED_LEVELS_PATH,
+        ),
+    )
+    # Создание игры инициализирует сцены и уровни, сам игровой цикл не запускается.
+    Game(
+        max_fps=GameConfig.MAX_FPS,
+        base_fps=GameConfig.BASE_FPS,
+        scenes_manager=scenes_manager,
+    )
+
+    results: dict = LevelsBenchmark(
+        scenes_manager=scenes_manager,
+        frames_count=args.frames,
+    ).run(levels_indexes=args.levels)
+
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=4)
+
+
+def _parse_args() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(description='Замер времени кадра на всех уровнях.')
+    parser.add_argument('--frames', type=int, default=_DEFAULT_FRAMES_COUNT,
+                        help='максимальное количество кадров на уровень')
+    parser.add_argument('--levels', type=int, nargs='*', default=None,
+                        help='индексы уровней (по умолчанию все)')
+    parser.add_argument('--output', default=None,
+                        help='путь к JSON-файлу с результатами (по умолчанию stdout)')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+from statistics import quantiles, fmean
+from time import perf_counter
+from typing import Callable, Any
+
+from pygame import K_RIGHT, K_SPACE
+
+import game.map_.ui.player as player_module
+from engine.map_.abstract_map_object import AbstractMapObject
+from engine.scenes.manager import ScenesManager
+from game.assets.save import FILE_PATH as SAVE_FILE_PATH, save_state
+from game.scenes.keys import SceneKey
+from game.scenes.level.scene import LevelScene
+
+__all__ = (
+    'LevelsBenchmark',
+)
+
+MillisecondsStatsType = dict[str, float]
+LevelResultType = dict[str, Any]
+
+
+# Подменяет 'pygame.key.get_pressed()': игрок идёт вправо и периодически прыгает.
+class _ScriptedKeys:
+
+    _JUMP_PERIOD: int = 40
+
+    def __init__(self) -> None:
+        self.frame_index: int = 0
+
+    def __getitem__(self, key: int) -> bool:
+        if key == K_RIGHT:
+            return True
+        if key == K_SPACE:
+            return (self.frame_index // self._JUMP_PERIOD) % 2 == 0
+        return False
+
+
+class _Stopwatch:
+
+    def __init__(self) -> None:
+        self._started_at: float = 0
+        self._current: float = 0
+        # Вложенные вызовы (например, 'super()._draw()') не должны учитываться дважды.
+        self._depth: int = 0
+        self.samples: list[float] = []
+
+    def wrap(self, function: Callable) -> Callable:
+        def wrapper(*args, **kwargs) -> Any:
+            if self._depth == 0:
+                self._started_at = perf_counter()
+            self._depth += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._current += perf_counter() - self._started_at
+        return wrapper
+
+    def lap(self) -> None:
+        self.samples.append(self._current * 1000)
+        self._current = 0
+
+
+class LevelsBenchmark:
+
+    _PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+    def __init__(self, scenes_manager: ScenesManager,
+                 frames_count: int,
+                 ) -> None:
+        self._scenes_manager = scenes_manager
+        self._levels_manager = scenes_manager.levels_manager
+        self._frames_count = frames_count
+        self._keys: _ScriptedKeys = _ScriptedKeys()
+
+    def run(self, levels_indexes: list[int] | None = None) -> dict[str, Any]:
+        if levels_indexes is None:
+            levels_indexes = [level.index for level in self._levels_manager.levels]
+
+        # Прохождение уровня сохраняет монеты, а бенчмарк не должен их менять.
+        save_file_backup: bytes = SAVE_FILE_PATH.read_bytes()
+        original_get_pressed: Callable = player_module.get_pressed
+        player_module.get_pressed = lambda: self._keys
+        try:
+            return {
+                'frames_count': self._frames_count,
+                'levels': [self._run_level(level_index) for level_index in levels_indexes],
+            }
+        finally:
+            player_module.get_pressed = original_get_pressed
+            save_state.flush()
+            SAVE_FILE_PATH.write_bytes(save_file_backup)
+
+    def _run_level(self, level_index: int) -> LevelResultType:
+        level = self._levels_manager.switch_to(level_index)
+        scene: LevelScene = self._scenes_manager.switch_to(SceneKey.LEVEL)
+
+        started_at: float = perf_counter()
+        scene.reset()
+        reset_ms: float = (perf_counter() - started_at) * 1000
+
+        map_ = scene.map_
+        scene_stopwatch, map_stopwatch, grid_stopwatch, draw_stopwatch = (
+            _Stopwatch(), _Stopwatch(), _Stopwatch(), _Stopwatch(),
+        )
+        map_.update = map_stopwatch.wrap(map_.update)
+        map_.grid.update = grid_stopwatch.wrap(map_.grid.update)
+        originals_draws: dict[type, Callable] = self._wrap_draws(draw_stopwatch)
+
+        simulated_counts: list[int] = []
+        visible_counts: list[int] = []
+        try:
+            for frame_index in range(self._frames_count):
+                # Смерть или прохождение уровня переключают сцену.
+                if self._scenes_manager.current_scene is not scene:
+                    break
+                self._keys.frame_index = frame_index
+                scene_stopwatch.wrap(scene.update)()
+                for stopwatch in (scene_stopwatch, map_stopwatch, grid_stopwatch, draw_stopwatch):
+                    stopwatch.lap()
+                simulated_counts.append(len(map_.grid.simulated_objects))
+                visible_counts.append(len(map_.grid.visible_objects))
+        finally:
+            del map_.update
+            del map_.grid.update
+            self._unwrap_draws(originals_draws)
+
+        map_logic_samples: list[float] = [
+            map_ms - draw_ms for map_ms, draw_ms in zip(map_stopwatch.samples, draw_stopwatch.samples)
+        ]
+        return {
+            'level_index': level.index,
+            'file_name': level.file_path.name,
+            'w': level.w,
+            'h': level.h,
+            'level_objects_count': len(level.objects),
+            'grid_objects_count': map_.grid.objects_count,
+            'simulated_objects_count': self._calc_counts_stats(simulated_counts),
+            'visible_objects_count': self._calc_counts_stats(visible_counts),
+            'frames_count': len(scene_stopwatch.samples),
+            'reset_ms': reset_ms,
+            'scene_update_ms': self._calc_stats(scene_stopwatch.samples),
+            'map_update_ms': self._calc_stats(map_stopwatch.samples),
+            'map_logic_ms': self._calc_stats(map_logic_samples),
+            'map_draw_ms': self._calc_stats(draw_stopwatch.samples),
+            'grid_update_ms': self._calc_stats(grid_stopwatch.samples),
+            'player_hp': map_.player.hp,
+            'player_xy': map_.player.get_rect().topleft,
+        }
+
+    @staticmethod
+    def _wrap_draws(stopwatch: _Stopwatch) -> dict[type, Callable]:
+        originals: dict[type, Callable] = {}
+        types_: list[type] = [AbstractMapObject]
+        while types_:
+            type_: type = types_.pop()
+            types_.extend(type_.__subclasses__())
+            if '_draw' in type_.__dict__ and type_ not in originals:
+                originals[type_] = type_.__dict__['_draw']
+                type_._draw = stopwatch.wrap(originals[type_])
+        return originals
+
+    @staticmethod
+    def _unwrap_draws(originals: dict[type, Callable]) -> None:
+        for type_, draw in originals.items():
+            type_._draw = draw
+
+    def _calc_stats(self, samples: list[float]) -> MillisecondsStatsType:
+        if not samples:
+            return {}
+        # Для одного замера квантили не определены.
+        percentiles: list[float] = quantiles(samples * 2 if len(samples) == 1 else samples,
+                                             n=100, method='inclusive')
+        stats: MillisecondsStatsType = {
+            f'p{percentile}': percentiles[percentile - 1] for percentile in self._PERCENTILES
+        }
+        stats['mean'] = fmean(samples)
+        stats['max'] = max(samples)
+        return stats
+
+    @staticmethod
+    def _calc_counts_stats(counts: list[int]) -> dict[str, float]:
+        if not counts:
+            return {}
+        return {
+            'mean': fmean(counts),
+            'max': max(counts),
+        }
@@ -11,7 +11,7 @@ from editor.scenes_manager import ScenesManager, EDITOR_SCENE_KEY
 
 def main() -> None:
     flags = GameConfig.WINDOW_FLAGS & (~pg.FULLSCREEN)
-    set_global_screen(GameConfig.WINDOW_HEIGHT, 'Editor', flags, ICON_IMAGE)
+    set_global_screen(GameConfig.WINDOW_HEIGHT, 'Editor', flags, ICON_IMAGE.get())
 
     scenes_manager = ScenesManager(EDITOR_SCENE_KEY, LevelsManager(GameConfig.LEVELS_PATH))
     game = Game(GameConfig.MAX_FPS, scenes_manager)
@@ -63,9 +63,14 @@ class AbstractEditorObject(ABC):
     _image: pg.Surface
 
     def __init__(self, x: int, y: int) -> None:
+        self._image = self._get_image()
         self._rect = self._image.get_rect(x=x, y=y)
         self._screen = pg.display.get_surface()
 
+    def _get_image(self) -> pg.Surface:
+        # Изображения из групп ресурсов берутся при создании объекта, а не при импорте модуля.
+        return self._image
+
     @property
     def x(self) -> int:
         return self._rect.x
@@ -124,10 +129,7 @@ class AbstractMovingEditorObject(AbstractEditorObject):
 
 class Dirt(AbstractBlockEditorObject):
 
-    _DEFAULT_IMAGE = DirtImages.DEFAULT
-    _RIGHT_IMAGE = DirtImages.RIGHT
-    _LEFT_IMAGE = DirtImages.LEFT
-    _GRASS_IMAGE = DirtImages.GRASS_LIST[1]
+    _IMAGES = DirtImages
 
     def __init__(self, x: int, y: int,
                  grass_enabled: bool = False,
@@ -135,16 +137,16 @@ class Dirt(AbstractBlockEditorObject):
                  ) -> None:
         self._direction = direction
         if self._direction == Direction.RIGHT:
-            self._image = self._RIGHT_IMAGE
+            self._image = self._IMAGES.RIGHT
         elif self._direction == Direction.LEFT:
-            self._image = self._LEFT_IMAGE
+            self._image = self._IMAGES.LEFT
         else:
-            self._image = self._DEFAULT_IMAGE
+            self._image = self._IMAGES.DEFAULT
 
         self._grass_enabled = grass_enabled
         if self._grass_enabled:
             self._image = self._image.copy()
-            self._image.blit(self._GRASS_IMAGE, (0, 0))
+            self._image.blit(self._IMAGES.GRASS_LIST[1], (0, 0))
 
         super().__init__(x=x, y=y)
 
@@ -157,19 +159,31 @@ class Dirt(AbstractBlockEditorObject):
 
 
 class BackgroundDirt(AbstractBackgroundEditorObject):
-    _image = DirtImages.BACKGROUND
+    _IMAGES = DirtImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.BACKGROUND
 
 
 class Bricks(AbstractBlockEditorObject):
-    _image = BricksImages.DEFAULT
+    _IMAGES = BricksImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.DEFAULT
 
 
 class BackgroundBricks(AbstractBackgroundEditorObject):
-    _image = BricksImages.BACKGROUND
+    _IMAGES = BricksImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.BACKGROUND
 
 
 class Player(AbstractMovingEditorObject):
-    _image = PlayerDefaultImages.STAND_RIGHT[0]
+    _IMAGES = PlayerDefaultImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.STAND_RIGHT[0]
 
 
 class Finish(AbstractEditorObject):
@@ -223,17 +237,23 @@ class AbstractEditorObjectToDisposableCollect(AbstractEditorObject):
 
 
 class Coin(AbstractEditorObjectToDisposableCollect):
-    _image = COIN_IMAGES[0]
+    _IMAGES = COIN_IMAGES
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES[0]
 
 
 class Chest(AbstractEditorObjectToDisposableCollect):
-    _image = CHEST_IMAGES[0]
+    _IMAGES = CHEST_IMAGES
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES[0]
 
 
 class Hint(AbstractEditorObject):
 
     _Z_INDEX = ZIndex.HINT
-    _image = HINT_IMAGES[0]
+    _IMAGES = HINT_IMAGES
 
     def __init__(self, x: int, y: int, text: str | None = None) -> None:
         super().__init__(x, y)
@@ -247,13 +267,22 @@ class Hint(AbstractEditorObject):
             'text': self._text,
         }
 
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES[0]
+
 
 class Heart(AbstractEditorObject):
-    _image = HEART_IMAGES[0]
+    _IMAGES = HEART_IMAGES
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES[0]
 
 
 class Shield(AbstractEditorObject):
-    _image = SHIELD_IMAGES[0]
+    _IMAGES = SHIELD_IMAGES
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES[0]
 
 
 class Web(AbstractEditorObject):
@@ -354,25 +383,37 @@ class AbstractXPatrolEnemyEditorObject(AbstractEditorObject):
 
 
 class Skeleton(AbstractXPatrolEnemyEditorObject):
-    _image = SkeletonImages.GO_RIGHT[0]
+    _IMAGES = SkeletonImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.GO_RIGHT[0]
 
 
 class Slug(AbstractXPatrolEnemyEditorObject):
-    _image = SlugImages.GO[0]
+    _IMAGES = SlugImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.GO[0]
 
 
 class Bat(AbstractXPatrolEnemyEditorObject):
-    _image = BatImages.GO_RIGHT[0]
+    _IMAGES = BatImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.GO_RIGHT[0]
 
 
 class Ghost(AbstractXPatrolEnemyEditorObject):
-    _image = GhostImages.GO_RIGHT
+    _IMAGES = GhostImages
+
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.GO_RIGHT
 
 
 class Spider(AbstractEditorObject):
 
     _Z_INDEX = ZIndex.MOVING_OBJECT
-    _image = SpiderImages.STAND
+    _IMAGES = SpiderImages
 
     def __init__(self, x: int, y: int, end_y: int = 0) -> None:
         super().__init__(x, y)
@@ -396,6 +437,9 @@ class Spider(AbstractEditorObject):
             'end_y': self._end_y,
         }
 
+    def _get_image(self) -> pg.Surface:
+        return self._IMAGES.STAND
+
 
 class Cannon(AbstractEditorObject):
     _IMAGES = CannonImages
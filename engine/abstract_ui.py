@@ -1,6 +1,7 @@
-from pygame import Surface
+from pygame import Surface, Rect
 from abc import ABC, abstractmethod
 
+from engine.common.float_rect import FloatRect
 from engine.common.typing_ import AnyRectType
 from engine.screen_access_mixin import ScreenAccessMixin
 
@@ -53,7 +54,10 @@ class AbstractRectangularUI(AbstractUI):
     def y(self) -> int:
         return self._rect.y
 
-    def get_rect(self) -> AnyRectType:
+    def get_rect(self) -> Rect:
+        # Снаружи нужен обычный 'Rect', поэтому у 'FloatRect' копируется его целочисленный прямоугольник.
+        if isinstance(self._rect, FloatRect):
+            return self._rect.rect.copy()
         return self._rect.copy()
 
     def update(self) -> None:
@@ -1,9 +1,8 @@
-from engine.fps import get_max_fps
+from engine.fps import get_delta_time
 
 __all__ = (
     'TimeCounter',
     'FramesCounter',
-    'calc_count_by_fps_from_seconds',
 )
 
 
@@ -21,24 +20,23 @@ class TimeCounter:
 
     def __init__(self, duration_as_seconds: float) -> None:
         self._duration_as_seconds = duration_as_seconds
-        self._max_count: float = calc_count_by_fps_from_seconds(duration_as_seconds)
-        self._current_count: int = 0
+        self._seconds_left: float = 0
 
     def restart(self) -> None:
-        self._current_count = self._max_count
+        self._seconds_left = self._duration_as_seconds
 
     def stop(self) -> None:
-        self._current_count = 0
+        self._seconds_left = 0
 
     def delta(self) -> float:
-        return self._max_count - self._current_count
+        return self._duration_as_seconds - self._seconds_left
 
     def next(self) -> None:
-        if self._current_count > 0:
-            self._current_count -= 1
+        if self._seconds_left > 0:
+            self._seconds_left -= get_delta_time()
 
     def is_working(self) -> bool:
-        return self._current_count > 0
+        return self._seconds_left > 0
 
 
 class FramesCounter:
@@ -88,7 +86,3 @@ class FramesCounter:
 
     def start(self) -> None:
         self._is_end = False
-
-
-def calc_count_by_fps_from_seconds(seconds: float) -> float:
-    return seconds * get_max_fps()
@@ -1,4 +1,5 @@
 from pathlib import Path
+from os import replace, fsync
 import json
 
 __all__ = (
@@ -18,5 +19,11 @@ def load_json(path: Path) -> dict:
 
 
 def save_json(path: Path, json_: dict) -> None:
-    with open(path, 'w', encoding='utf-8') as file:
-        return json.dump(json_, file, indent=4, ensure_ascii=False)
+    # Запись во временный файл с последующей заменой, чтобы при падении игры
+    # на диске не остался наполовину записанный файл.
+    tmp_path: Path = Path(path).with_name(Path(path).name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(json_, file, indent=4, ensure_ascii=False)
+        file.flush()
+        fsync(file.fileno())
+    replace(tmp_path, path)
@@ -1,30 +1,133 @@
 from pygame import Rect
-from typing import Any
 
 __all__ = (
     'FloatRect',
 )
 
 
-class FloatRect(Rect):
-
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.float_x: float = self.x
-        self.float_y: float = self.y
-
-    def __setattr__(self, key: str, value: int | float | Any) -> None:
-        old_x = self.x
-        old_y = self.y
-        super().__setattr__(key, value)
-        if self.x != old_x:
-            super().__setattr__('float_x', self.x)
-        if self.y != old_y:
-            super().__setattr__('float_y', self.y)
-        if key == 'float_x':
-            super().__setattr__('x', int(self.float_x))
-        elif key == 'float_y':
-            super().__setattr__('y', int(self.float_y))
-
-    def __copy__(self) -> 'FloatRect':
-        return FloatRect(self)
+# Дробная позиция хранится отдельно от целочисленного 'Rect', который обновляется только
+# при записи позиции, поэтому чтение координат и проверка столкновений выполняются на стороне pygame.
+class FloatRect:
+    """Example:
+    rect = FloatRect(image.get_rect(x=x, y=y))
+    rect.float_x += x_vel * time_scale
+    if rect.colliderect(player_rect):
+        rect.right = player_rect.left
+    # Общий 'Rect' нельзя изменять напрямую, иначе дробная позиция рассинхронизируется.
+    surface.blit(image, rect.rect)
+    """
+
+    __slots__ = ('_float_x', '_float_y', '_rect')
+
+    def __init__(self, *args) -> None:
+        self._rect: Rect = Rect(*args)
+        self._float_x: float = self._rect.x
+        self._float_y: float = self._rect.y
+
+    @property
+    def rect(self) -> Rect:
+        return self._rect
+
+    @property
+    def float_x(self) -> float:
+        return self._float_x
+
+    @float_x.setter
+    def float_x(self, value: float) -> None:
+        self._float_x = value
+        self._rect.x = int(value)
+
+    @property
+    def float_y(self) -> float:
+        return self._float_y
+
+    @float_y.setter
+    def float_y(self, value: float) -> None:
+        self._float_y = value
+        self._rect.y = int(value)
+
+    # Запись целой координаты не сбрасывает дробную часть, если целая часть не изменилась.
+    @property
+    def x(self) -> int:
+        return self._rect.x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        if value != self._rect.x:
+            self._rect.x = value
+            self._float_x = value
+
+    @property
+    def y(self) -> int:
+        return self._rect.y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        if value != self._rect.y:
+            self._rect.y = value
+            self._float_y = value
+
+    left = x
+    top = y
+
+    @property
+    def right(self) -> int:
+        return self._rect.right
+
+    @right.setter
+    def right(self, value: int) -> None:
+        self.x = value - self._rect.w
+
+    @property
+    def bottom(self) -> int:
+        return self._rect.bottom
+
+    @bottom.setter
+    def bottom(self, value: int) -> None:
+        self.y = value - self._rect.h
+
+    @property
+    def topleft(self) -> tuple[int, int]:
+        return self._rect.topleft
+
+    @topleft.setter
+    def topleft(self, value: tuple[int, int]) -> None:
+        self.x, self.y = value
+
+    @property
+    def centerx(self) -> int:
+        return self._rect.centerx
+
+    @property
+    def centery(self) -> int:
+        return self._rect.centery
+
+    @property
+    def center(self) -> tuple[int, int]:
+        return self._rect.center
+
+    @property
+    def w(self) -> int:
+        return self._rect.w
+
+    @property
+    def h(self) -> int:
+        return self._rect.h
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._rect.size
+
+    def colliderect(self, rect: Rect) -> bool:
+        return self._rect.colliderect(rect)
+
+    def copy(self) -> 'FloatRect':
+        copy: FloatRect = FloatRect(self._rect)
+        copy._float_x = self._float_x
+        copy._float_y = self._float_y
+        return copy
+
+    __copy__ = copy
+
+    def __repr__(self) -> str:
+        return f'<FloatRect({self._float_x}, {self._float_y}, {self._rect.w}, {self._rect.h})>'
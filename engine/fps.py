@@ -1,15 +1,45 @@
 __all__ = (
     'init_max_fps',
     'get_max_fps',
+    'get_base_fps',
+    'set_delta_time',
+    'get_delta_time',
+    'get_time_scale',
 )
 
 _max_fps: float = 0
+# Скорости и ускорения объектов заданы в пикселях за кадр при этой частоте.
+_base_fps: float = 0
+# Длительность последнего шага симуляции в секундах.
+_delta_time: float = 0
 
 
-def init_max_fps(max_fps: float) -> None:
-    global _max_fps
+def init_max_fps(max_fps: float, base_fps: float | None = None) -> None:
+    global _max_fps, _base_fps
     _max_fps = max_fps
+    if base_fps is None:
+        base_fps = max_fps
+    _base_fps = base_fps
+    set_delta_time(1 / _base_fps)
 
 
 def get_max_fps() -> float:
     return _max_fps
+
+
+def get_base_fps() -> float:
+    return _base_fps
+
+
+def set_delta_time(delta_time: float) -> None:
+    global _delta_time
+    _delta_time = delta_time
+
+
+def get_delta_time() -> float:
+    return _delta_time
+
+
+# Во сколько раз последний шаг длиннее кадра при базовой частоте.
+def get_time_scale() -> float:
+    return _delta_time * _base_fps
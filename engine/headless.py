@@ -0,0 +1,21 @@
+from os import environ
+
+__all__ = (
+    'HEADLESS_ENV_VAR',
+    'is_headless',
+    'enable_headless',
+)
+
+# Без окна и звука: для тестов, бенчмарков и запуска на сервере.
+HEADLESS_ENV_VAR: str = 'PIXEL_HEADLESS'
+
+
+def is_headless() -> bool:
+    return environ.get(HEADLESS_ENV_VAR, '') not in ('', '0')
+
+
+# Должна вызываться до импорта 'engine.screen', т.к. тот инициализирует pygame.
+def enable_headless() -> None:
+    environ[HEADLESS_ENV_VAR] = '1'
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    environ['SDL_AUDIODRIVER'] = 'dummy'
@@ -0,0 +1,102 @@
+from time import perf_counter
+from typing import Callable, Generic, Iterable, TypeVar
+
+__all__ = (
+    'LazyAsset',
+    'LazyAssetsGroup',
+    'AssetsPreloader',
+    'collect_lazy_assets',
+)
+
+AssetType = TypeVar('AssetType')
+
+
+class LazyAsset(Generic[AssetType]):
+    """Example:
+    class BatImages(LazyAssetsGroup):
+        GO_RIGHT: LazyAsset[ImagesListType] = LazyAsset(partial(load_images, path))
+
+    BatImages.GO_RIGHT  # Список изображений, загружается при первом обращении.
+    """
+
+    def __init__(self, load: Callable[[], AssetType]) -> None:
+        self._load = load
+        self._is_loaded: bool = False
+        self._value: AssetType | None = None
+        # Классы и имена атрибутов, через которые доступен ресурс.
+        self._owners: list[tuple[type, str]] = []
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._owners.append((owner, name))
+
+    def __get__(self, instance: object | None, owner: type) -> AssetType:
+        return self.get()
+
+    def get(self) -> AssetType:
+        if not self._is_loaded:
+            self._value = self._load()
+            self._is_loaded = True
+            # Дальше атрибуты хранят сам ресурс, и обращение к ним ничего не стоит.
+            for owner, name in self._owners:
+                setattr(owner, name, self._value)
+        return self._value
+
+
+# Класс, атрибуты которого - ленивые ресурсы или вложенные группы.
+class LazyAssetsGroup:
+    pass
+
+
+def collect_lazy_assets(*types_: type) -> list[LazyAsset]:
+    # Ресурсы, на которые ссылаются атрибуты классов (с учётом родителей и групп), ещё не загруженные.
+    assets: dict[int, LazyAsset] = {}
+    visited_types: set[type] = set()
+    types_to_visit: list[type] = [mro_type for type_ in types_ for mro_type in type_.__mro__]
+    while types_to_visit:
+        type_: type = types_to_visit.pop()
+        if type_ in visited_types:
+            continue
+        visited_types.add(type_)
+        for value in vars(type_).values():
+            if isinstance(value, LazyAsset):
+                if not value.is_loaded:
+                    assets[id(value)] = value
+            elif isinstance(value, type) and issubclass(value, LazyAssetsGroup):
+                types_to_visit.append(value)
+    return list(assets.values())
+
+
+class AssetsPreloader:
+    """Example:
+    preloader = AssetsPreloader()
+    preloader.add(collect_lazy_assets(Bat, Slug))
+    ...
+    preloader.update()  # Каждый кадр.
+    """
+
+    # Сколько секунд кадра можно потратить на загрузку; хотя бы один ресурс загружается всегда.
+    _TIME_BUDGET: float = 0.004
+
+    def __init__(self) -> None:
+        self._queue: list[LazyAsset] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._queue
+
+    def add(self, assets: Iterable[LazyAsset]) -> None:
+        self._queue.extend(asset for asset in assets if asset not in self._queue)
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+    def update(self) -> None:
+        started_at: float = perf_counter()
+        while self._queue:
+            self._queue.pop(0).get()
+            if perf_counter() - started_at >= self._TIME_BUDGET:
+                return
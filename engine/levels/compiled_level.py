@@ -0,0 +1,225 @@
+from json import dumps, loads
+from mmap import mmap, ACCESS_READ
+from os import replace
+from pathlib import Path
+from struct import Struct, error as StructError
+from typing import Any
+
+from engine.levels.level_data import LevelData
+from engine.levels.object_data_tuple import LevelObjectDataTuple
+
+__all__ = (
+    'CompiledLevelError',
+    'compile_level',
+    'compile_level_data',
+    'is_compiled_level_actual',
+    'load_compiled_level_data',
+    'load_compiled_level_objects',
+)
+
+# Двоичный формат уровня (little-endian):
+#   заголовок      _HEADER;
+#   пул строк      _STRING_LEN и utf-8 байты каждой строки;
+#   линии камеры   _CAMERA_LINE на каждую линию;
+#   таблица схем   _SCHEMA и _STRING_INDEX на каждое имя аргумента;
+#   объекты        _OBJECT и _VALUE на каждый аргумент схемы.
+# Схема - это тип объекта, фабричный метод и имена аргументов, поэтому запись объекта
+# имеет фиксированный для своей схемы размер и содержит только значения аргументов.
+_MAGIC: bytes = b'PXLV'
+_VERSION: int = 1
+
+_HEADER: Struct = Struct('<4sHIHIii??HI')
+_STRING_LEN: Struct = Struct('<I')
+_STRING_INDEX: Struct = Struct('<I')
+_CAMERA_LINE: Struct = Struct('<iii')
+_SCHEMA: Struct = Struct('<IIH')
+_OBJECT: Struct = Struct('<H')
+_VALUE: Struct = Struct('<Bi')
+
+_NONE_TAG: int = 0
+_INT_TAG: int = 1
+_BOOL_TAG: int = 2
+_STR_TAG: int = 3
+
+_SchemaType = tuple[str, str, tuple[str, ...]]
+
+
+class CompiledLevelError(ValueError):
+    pass
+
+
+class _StringPool:
+
+    def __init__(self) -> None:
+        self._indexes: dict[str, int] = {}
+
+    @property
+    def strings(self) -> list[str]:
+        return list(self._indexes)
+
+    def index(self, string: str) -> int:
+        if string not in self._indexes:
+            self._indexes[string] = len(self._indexes)
+        return self._indexes[string]
+
+
+def compile_level(json_path: Path, compiled_path: Path) -> None:
+    with open(json_path, 'r', encoding='utf-8') as file:
+        data: LevelData = loads(file.read())
+    compile_level_data(data, compiled_path)
+
+
+def compile_level_data(data: LevelData, compiled_path: Path) -> None:
+    pool: _StringPool = _StringPool()
+    extra_data_index: int = pool.index(dumps(data['extra_data'], ensure_ascii=False))
+
+    schemas: dict[_SchemaType, int] = {}
+    objects_parts: list[bytes] = []
+    for object_data in data['objects']:
+        schema: _SchemaType = (
+            object_data['type'],
+            object_data.get('factory_method', '__call__'),
+            tuple(object_data['args']),
+        )
+        schema_index: int = schemas.setdefault(schema, len(schemas))
+        objects_parts.append(_OBJECT.pack(schema_index))
+        for value in object_data['args'].values():
+            objects_parts.append(_pack_value(value, pool))
+
+    schemas_parts: list[bytes] = []
+    for type_, factory_method, args_names in schemas:
+        schemas_parts.append(_SCHEMA.pack(pool.index(type_), pool.index(factory_method), len(args_names)))
+        for arg_name in args_names:
+            schemas_parts.append(_STRING_INDEX.pack(pool.index(arg_name)))
+
+    strings: list[str] = pool.strings
+    strings_parts: list[bytes] = []
+    for string in strings:
+        encoded: bytes = string.encode('utf-8')
+        strings_parts.append(_STRING_LEN.pack(len(encoded)))
+        strings_parts.append(encoded)
+
+    lines: list[list[int]] = data['camera_bounding_horizontal_lines']
+    header: bytes = _HEADER.pack(
+        _MAGIC, _VERSION,
+        len(strings), len(schemas), len(data['objects']),
+        data['w'], data['h'],
+        data['is_available'], data['is_completed'],
+        len(lines), extra_data_index,
+    )
+
+    tmp_path: Path = compiled_path.with_name(compiled_path.name + '.tmp')
+    compiled_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, 'wb') as file:
+        file.write(header)
+        file.write(b''.join(strings_parts))
+        file.write(b''.join(_CAMERA_LINE.pack(*line) for line in lines))
+        file.write(b''.join(schemas_parts))
+        file.write(b''.join(objects_parts))
+    replace(tmp_path, compiled_path)
+
+
+def _pack_value(value: Any, pool: _StringPool) -> bytes:
+    if value is None:
+        return _VALUE.pack(_NONE_TAG, 0)
+    # bool - подкласс int, поэтому проверяется раньше.
+    if isinstance(value, bool):
+        return _VALUE.pack(_BOOL_TAG, value)
+    if isinstance(value, int):
+        try:
+            return _VALUE.pack(_INT_TAG, value)
+        except StructError as error:
+            raise CompiledLevelError(f'Число {value} не помещается в 32 бита.') from error
+    if isinstance(value, str):
+        return _VALUE.pack(_STR_TAG, pool.index(value))
+    raise CompiledLevelError(f'Неподдерживаемый тип аргумента: {type(value).__name__}.')
+
+
+def is_compiled_level_actual(json_path: Path, compiled_path: Path) -> bool:
+    if not compiled_path.exists() or compiled_path.stat().st_mtime < json_path.stat().st_mtime:
+        return False
+    with open(compiled_path, 'rb') as file:
+        header: bytes = file.read(_HEADER.size)
+    return len(header) == _HEADER.size and _HEADER.unpack(header)[:2] == (_MAGIC, _VERSION)
+
+
+# Данные уровня без объектов: они читаются отдельно, только когда нужны.
+def load_compiled_level_data(compiled_path: Path) -> LevelData:
+    with open(compiled_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+        reader: _Reader = _Reader(buffer)
+        return reader.read_level_data()
+
+
+def load_compiled_level_objects(compiled_path: Path) -> list[LevelObjectDataTuple]:
+    with open(compiled_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+        reader: _Reader = _Reader(buffer)
+        reader.read_level_data()
+        return reader.read_objects()
+
+
+class _Reader:
+
+    def __init__(self, buffer: mmap | bytes) -> None:
+        self._buffer = buffer
+        self._offset: int = 0
+        self._strings: list[str] = []
+        self._objects_count: int = 0
+        self._schemas_count: int = 0
+
+    def _unpack(self, struct: Struct) -> tuple:
+        values: tuple = struct.unpack_from(self._buffer, self._offset)
+        self._offset += struct.size
+        return values
+
+    def read_level_data(self) -> LevelData:
+        (magic, version, strings_count, self._schemas_count, self._objects_count,
+         w, h, is_available, is_completed, lines_count, extra_data_index) = self._unpack(_HEADER)
+        if magic != _MAGIC or version != _VERSION:
+            raise CompiledLevelError('Неизвестный формат скомпилированного уровня.')
+
+        for _ in range(strings_count):
+            string_len: int = self._unpack(_STRING_LEN)[0]
+            self._strings.append(str(self._buffer[self._offset:self._offset + string_len], 'utf-8'))
+            self._offset += string_len
+
+        lines: list[list[int]] = [list(self._unpack(_CAMERA_LINE)) for _ in range(lines_count)]
+        return {
+            'objects': [],
+            'is_available': is_available,
+            'is_completed': is_completed,
+            'w': w,
+            'h': h,
+            'extra_data': loads(self._strings[extra_data_index]),
+            'camera_bounding_horizontal_lines': lines,
+        }
+
+    def read_objects(self) -> list[LevelObjectDataTuple]:
+        schemas: list[tuple[str, str, tuple[str, ...], Struct]] = []
+        for _ in range(self._schemas_count):
+            type_index, factory_method_index, args_count = self._unpack(_SCHEMA)
+            args_names: tuple[str, ...] = tuple(
+                self._strings[self._unpack(_STRING_INDEX)[0]] for _ in range(args_count)
+            )
+            # Значения всех аргументов записи читаются за один вызов.
+            values_struct: Struct = Struct('<' + _VALUE.format[1:] * args_count)
+            schemas.append((self._strings[type_index], self._strings[factory_method_index], args_names, values_struct))
+
+        objects: list[LevelObjectDataTuple] = []
+        for _ in range(self._objects_count):
+            type_, factory_method, args_names, values_struct = schemas[self._unpack(_OBJECT)[0]]
+            values: tuple = self._unpack(values_struct)
+            args: dict[str, int | str | bool | None] = {
+                arg_name: self._decode_value(values[i * 2], values[i * 2 + 1])
+                for i, arg_name in enumerate(args_names)
+            }
+            objects.append(LevelObjectDataTuple(type=type_, args=args, factory_method=factory_method))
+        return objects
+
+    def _decode_value(self, tag: int, value: int) -> int | str | bool | None:
+        if tag == _INT_TAG:
+            return value
+        if tag == _BOOL_TAG:
+            return bool(value)
+        if tag == _STR_TAG:
+            return self._strings[value]
+        return None
@@ -1,11 +1,20 @@
 from pathlib import Path
+from threading import Lock
 from typing import Generic
 
-from engine.common.files import save_json, load_json
+from engine.common.files import del_extension, load_json
 from engine.common.typing_ import CameraBoundingLinesType
 from engine.levels.object_data_tuple import LevelObjectDataTuple
 from engine.levels.level_data import LevelData
+from engine.levels.progress import LevelsProgress
+from engine.levels.progress_data import LevelProgressData
 from engine.levels.typing_ import ExtraDataType
+from engine.levels.compiled_level import (
+    compile_level,
+    is_compiled_level_actual,
+    load_compiled_level_data,
+    load_compiled_level_objects,
+)
 
 __all__ = (
     'Level',
@@ -14,24 +23,70 @@ __all__ = (
 
 class Level(Generic[ExtraDataType]):
 
-    def __init__(self, index: int, file_path: Path) -> None:
+    def __init__(self, index: int,
+                 file_path: Path,
+                 compiled_file_path: Path | None = None,
+                 progress: LevelsProgress | None = None,
+                 ) -> None:
         self._index = index
         self._file_path = file_path
-        self._data: LevelData[ExtraDataType] = load_json(self._file_path)
-        self._init_objects()
+        # JSON остаётся исходником для редактора, а игра читает скомпилированную копию.
+        self._compiled_file_path = compiled_file_path
+        # Объекты загружаются только для запускаемых уровней, меню нужны лишь метаданные.
+        self._objects: list[LevelObjectDataTuple] | None = None
+        # Объекты может заранее загружать фоновый поток.
+        self._objects_lock: Lock = Lock()
+        if self._compiled_file_path is None:
+            self._data: LevelData[ExtraDataType] = load_json(self._file_path)
+            self._data['objects'] = []
+        else:
+            if not is_compiled_level_actual(self._file_path, self._compiled_file_path):
+                compile_level(self._file_path, self._compiled_file_path)
+            self._data = load_compiled_level_data(self._compiled_file_path)
+        self._init_progress(progress)
+
+    def _init_progress(self, progress: LevelsProgress | None) -> None:
+        # Файл уровня только читается, а его флаги служат начальным прогрессом.
+        if progress is None:
+            progress = LevelsProgress()
+        self._progress_store = progress
+        self._progress_key: str = del_extension(self._file_path.name)
+        self._progress: LevelProgressData[ExtraDataType] = self._progress_store.get(self._progress_key) or {
+            'is_available': self._data['is_available'],
+            'is_completed': self._data['is_completed'],
+            'extra_data': dict(self._data['extra_data']),
+        }
+
+    def load_objects(self) -> list[LevelObjectDataTuple]:
+        with self._objects_lock:
+            if self._objects is None:
+                self._objects = self._read_objects()
+            return self._objects
+
+    def unload_objects(self) -> None:
+        with self._objects_lock:
+            self._objects = None
 
-    def _init_objects(self) -> None:
-        self._objects: list[LevelObjectDataTuple] = []
-        for i, object_data in enumerate(self._data['objects']):
-            self._objects.append(LevelObjectDataTuple(**object_data))
+    def _read_objects(self) -> list[LevelObjectDataTuple]:
+        if self._compiled_file_path is not None:
+            return load_compiled_level_objects(self._compiled_file_path)
+        return [LevelObjectDataTuple(**object_data) for object_data in load_json(self._file_path)['objects']]
 
     @property
     def index(self) -> int:
         return self._index
 
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
     @property
     def objects(self) -> list[LevelObjectDataTuple]:
-        return list(self._objects)
+        return list(self.load_objects())
+
+    @property
+    def objects_are_loaded(self) -> bool:
+        return self._objects is not None
 
     @property
     def w(self) -> int:
@@ -43,11 +98,11 @@ class Level(Generic[ExtraDataType]):
 
     @property
     def is_available(self) -> bool:
-        return self._data['is_available']
+        return self._progress['is_available']
 
     @property
     def is_completed(self) -> bool:
-        return self._data['is_completed']
+        return self._progress['is_completed']
 
     @property
     def camera_bounding_horizontal_lines(self) -> CameraBoundingLinesType:
@@ -55,27 +110,27 @@ class Level(Generic[ExtraDataType]):
 
     @property
     def extra(self) -> ExtraDataType:
-        return dict(self._data['extra_data'])
+        return dict(self._progress['extra_data'])
 
     def complete(self) -> None:
-        self._data['is_completed'] = True
-        self._save()
+        self._progress['is_completed'] = True
+        self._save_progress()
 
     def open(self) -> None:
-        self._data['is_available'] = True
-        self._save()
+        self._progress['is_available'] = True
+        self._save_progress()
 
     def close(self) -> None:
-        self._data['is_completed'] = False
-        self._data['is_available'] = False
-        self._data['extra_data'] = {
+        self._progress['is_completed'] = False
+        self._progress['is_available'] = False
+        self._progress['extra_data'] = {
             'ids': []
         }
-        self._save()
+        self._save_progress()
 
     def update_extra_data(self, **kwargs) -> None:
-        self._data['extra_data'].update(**kwargs)
-        self._save()
+        self._progress['extra_data'].update(**kwargs)
+        self._save_progress()
 
-    def _save(self) -> None:
-        save_json(self._file_path, self._data)
+    def _save_progress(self) -> None:
+        self._progress_store.set(self._progress_key, self._progress)
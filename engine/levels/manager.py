@@ -1,10 +1,13 @@
 from os import listdir
 from pathlib import Path
+from threading import Thread
 from traceback import print_exc
 
 from engine.common.files import del_extension
 from engine.common.singleton import SingletonMeta
 from engine.levels.level import Level
+from engine.levels.compiled_level import CompiledLevelError
+from engine.levels.progress import LevelsProgress
 
 __all__ = (
     'LevelsManager',
@@ -13,12 +16,25 @@ __all__ = (
 
 class LevelsManager(metaclass=SingletonMeta):
 
+    _COMPILED_LEVEL_EXTENSION: str = '.level'
+    # Сколько уровней держат объекты в памяти, включая текущий и заранее загруженный следующий.
+    _MAX_LOADED_LEVELS_COUNT: int = 3
+
     _levels: list[Level] = []
-    _current_level: Level
+    _current_level: Level | None = None
 
-    def __init__(self, levels_folder_path: Path) -> None:
+    def __init__(self, levels_folder_path: Path,
+                 compiled_levels_folder_path: Path | None = None,
+                 progress_file_path: Path | None = None,
+                 prefetch_next_level: bool = True,
+                 ) -> None:
         self._levels_folder_path = levels_folder_path
+        self._compiled_levels_folder_path = compiled_levels_folder_path
+        self._progress: LevelsProgress = LevelsProgress(progress_file_path)
+        self._prefetch_next_level = prefetch_next_level
         self._levels_count: int = 0
+        # Недавно использованные уровни, последний - самый свежий.
+        self._recently_used_levels: list[Level] = []
 
     @property
     def levels(self) -> list[Level]:
@@ -45,10 +61,25 @@ class LevelsManager(metaclass=SingletonMeta):
                 continue
 
     def add_level(self, file_path: Path) -> None:
-        level = Level(index=self._levels_count, file_path=file_path)
+        try:
+            level = Level(
+                index=self._levels_count,
+                file_path=file_path,
+                compiled_file_path=self._make_compiled_file_path(file_path),
+                progress=self._progress,
+            )
+        except CompiledLevelError:
+            # Уровень, который не удалось скомпилировать, читается напрямую из JSON.
+            print_exc()
+            level = Level(index=self._levels_count, file_path=file_path, progress=self._progress)
         self._levels_count += 1
         self._levels.append(level)
 
+    def _make_compiled_file_path(self, file_path: Path) -> Path | None:
+        if self._compiled_levels_folder_path is None:
+            return None
+        return self._compiled_levels_folder_path.joinpath(del_extension(file_path.name) + self._COMPILED_LEVEL_EXTENSION)
+
     def next_after(self, level_index: int) -> Level:
         if level_index != self.last_index:
             return self._levels[level_index + 1]
@@ -62,13 +93,45 @@ class LevelsManager(metaclass=SingletonMeta):
                 return level
 
     def switch_to(self, level_index: int) -> Level:
-        self._current_level = self._levels[level_index]
+        self._set_current_level(self._levels[level_index])
         return self._current_level
 
     def go_next(self) -> Level:
-        self._current_level = self.next_after(self._current_level.index)
+        self._set_current_level(self.next_after(self._current_level.index))
         return self._current_level
 
+    def prefetch(self, level_index: int) -> Level:
+        # Объекты уровня читаются в фоне, например пока игрок выбирает уровень в меню.
+        level: Level = self._levels[level_index]
+        self._prefetch(level)
+        self._evict_not_recently_used_levels()
+        return level
+
+    def _set_current_level(self, level: Level) -> None:
+        self._current_level = level
+        self._mark_as_recently_used(level)
+        if self._prefetch_next_level:
+            next_level: Level = self.next_after(level.index)
+            if next_level is not level:
+                self._prefetch(next_level)
+        self._evict_not_recently_used_levels()
+
+    def _prefetch(self, level: Level) -> None:
+        self._mark_as_recently_used(level)
+        if not level.objects_are_loaded:
+            Thread(target=level.load_objects, daemon=True).start()
+
+    def _mark_as_recently_used(self, level: Level) -> None:
+        if level in self._recently_used_levels:
+            self._recently_used_levels.remove(level)
+        self._recently_used_levels.append(level)
+
+    def _evict_not_recently_used_levels(self) -> None:
+        while len(self._recently_used_levels) > self._MAX_LOADED_LEVELS_COUNT:
+            level: Level = self._recently_used_levels.pop(0)
+            if level is not self._current_level:
+                level.unload_objects()
+
     def set_current_as_completed(self) -> None:
         self._current_level.complete()
         self.next_after(self.current_level.index).open()
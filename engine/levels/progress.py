@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from engine.common.files import save_json, load_json
+from engine.levels.progress_data import LevelProgressData
+
+__all__ = (
+    'LevelsProgress',
+)
+
+
+class LevelsProgress:
+    """Example:
+    progress = LevelsProgress(Path('progress.json'))
+    level_progress = progress.get('0') or default_progress
+    level_progress['is_completed'] = True
+    progress.set('0', level_progress)
+    """
+
+    def __init__(self, file_path: Path | None = None) -> None:
+        # Без пути прогресс хранится только в памяти (редактор, бенчмарк).
+        self._file_path = file_path
+        self._data: dict[str, LevelProgressData] = {}
+        if self._file_path is not None and self._file_path.exists():
+            self._data = load_json(self._file_path)
+
+    def get(self, level_key: str) -> LevelProgressData | None:
+        progress: LevelProgressData | None = self._data.get(level_key)
+        if progress is None:
+            return None
+        return {**progress, 'extra_data': dict(progress['extra_data'])}
+
+    def set(self, level_key: str, progress: LevelProgressData) -> None:
+        self._data[level_key] = {**progress, 'extra_data': dict(progress['extra_data'])}
+        if self._file_path is not None:
+            save_json(self._file_path, self._data)
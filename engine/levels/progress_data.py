@@ -0,0 +1,14 @@
+from typing import TypedDict, Generic
+
+from engine.levels.typing_ import ExtraDataType
+
+__all__ = (
+    'LevelProgressData',
+)
+
+
+class LevelProgressData(TypedDict, Generic[ExtraDataType]):
+
+    is_available: bool
+    is_completed: bool
+    extra_data: ExtraDataType
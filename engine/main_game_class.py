@@ -4,7 +4,9 @@ from pygame.display import flip
 
 from engine.exceptions import ExitFromGame
 from engine.common.singleton import SingletonMeta
-from engine.fps import init_max_fps
+from engine.fps import init_max_fps, set_delta_time
+from engine.headless import is_headless
+from engine.music import MusicPlayer
 from engine.scenes.manager import ScenesManager
 
 __all__ = (
@@ -14,24 +16,71 @@ __all__ = (
 
 class Game(metaclass=SingletonMeta):
 
+    # Без фиксированного шага более долгий кадр (загрузка уровня, подвисание) замедляет игру,
+    # иначе объекты за один шаг пролетали бы сквозь блоки.
+    _MAX_DELTA_TIME: float = 1 / 30
+    # С фиксированным шагом игра догоняет время целыми шагами, но не больше чем за этот промежуток,
+    # чтобы после долгого подвисания не обновлять сцену сотни раз подряд.
+    _MAX_FIXED_TIMESTEP_DELTA_TIME: float = 0.25
+
     def __init__(self, max_fps: float,
                  scenes_manager: ScenesManager,
+                 base_fps: float | None = None,
+                 fixed_timestep: bool = False,
                  ) -> None:
         self._max_fps = max_fps
-        init_max_fps(max_fps=self._max_fps)
+        if base_fps is None:
+            base_fps = max_fps
+        self._base_fps = base_fps
+        init_max_fps(max_fps=self._max_fps, base_fps=self._base_fps)
+
+        # С фиксированным шагом сцены всегда обновляются с базовой частотой,
+        # сколько бы кадров в секунду ни выдавал экран.
+        self._fixed_timestep = fixed_timestep
+        self._accumulated_time: float = 0
 
         self._scenes_manager = scenes_manager
         self._scenes_manager.init()
         self._scenes_manager.levels_manager.init()
 
         self._clock: Clock = Clock()
+        self._frames_count: int = 0
+
+    @property
+    def frames_count(self) -> int:
+        return self._frames_count
 
-    def run(self) -> None:
-        while True:
-            try:
-                self._clock.tick(self._max_fps)
-                self._scenes_manager.current_scene.update()
+    def run(self, max_frames_count: int | None = None) -> None:
+        try:
+            while max_frames_count is None or self._frames_count < max_frames_count:
+                delta_time: float = self._tick()
+                if self._fixed_timestep:
+                    self._update_with_fixed_timestep(delta_time)
+                else:
+                    set_delta_time(delta_time)
+                    self._scenes_manager.current_scene.update()
+                MusicPlayer().update()
                 flip()
-            except ExitFromGame:
-                break
+                self._frames_count += 1
+        except ExitFromGame:
+            pass
         quit()
+
+    def _tick(self) -> float:
+        if is_headless():
+            # Без окна симуляция идёт так быстро, как может, но с шагом базового кадра,
+            # поэтому её результат не зависит от скорости машины.
+            self._clock.tick()
+            return 1 / self._base_fps
+        delta_time: float = self._clock.tick(self._max_fps) / 1000
+        if self._fixed_timestep:
+            return min(delta_time, self._MAX_FIXED_TIMESTEP_DELTA_TIME)
+        return min(delta_time, self._MAX_DELTA_TIME)
+
+    def _update_with_fixed_timestep(self, delta_time: float) -> None:
+        step: float = 1 / self._base_fps
+        set_delta_time(step)
+        self._accumulated_time += delta_time
+        while self._accumulated_time >= step:
+            self._accumulated_time -= step
+            self._scenes_manager.current_scene.update()
@@ -1,6 +1,8 @@
 from abc import ABC
+from copy import copy
+from pygame import Surface, Rect, SRCALPHA, BLEND_RGBA_ADD
 
-from engine.common.typing_ import AnyRectType
+from engine.common.typing_ import AnyRectType, XYTupleType
 from engine.map_.grid.abstract_grid_object import AbstractGridObject
 
 __all__ = (
@@ -9,7 +11,13 @@ __all__ = (
 
 
 class AbstractMapObject(AbstractGridObject, ABC):
-    _Z_INDEX: int = 0
+    # Твёрдые объекты запекаются в `CollisionTilemap` при загрузке уровня и не должны двигаться.
+    _IS_SOLID: bool = False
+    # Статичные объекты не попадают в сетку: они один раз отрисовываются в `StaticChunk` своего слоя.
+    _IS_STATIC: bool = False
+    # Соседние объекты такого типа при загрузке уровня объединяются в прямоугольные области (см. `merge`).
+    # Подходит для неподвижных объектов с постоянным изображением, например воды и лестниц.
+    _IS_MERGEABLE: bool = False
 
     def __init__(self, map_: 'Map',
                  rect: AnyRectType,
@@ -18,11 +26,56 @@ class AbstractMapObject(AbstractGridObject, ABC):
         self._map = map_
 
     @property
-    def z_index(self) -> int:
-        return self._Z_INDEX
+    def is_solid(self) -> bool:
+        return self._IS_SOLID
+
+    @property
+    def is_static(self) -> bool:
+        return self._IS_STATIC
+
+    @property
+    def is_mergeable(self) -> bool:
+        return self._IS_MERGEABLE
+
+    @classmethod
+    def merge(cls, objects: list['AbstractMapObject'], rect: Rect) -> 'AbstractMapObject':
+        # Область - копия первого объекта с общим изображением всех объектов, сами объекты не изменяются.
+        image: Surface = Surface(rect.size, SRCALPHA)
+        drawn_xys: set[XYTupleType] = set()
+        for object_ in objects:
+            xy: XYTupleType = (object_._rect.x - rect.x, object_._rect.y - rect.y)
+            # Объекты, случайно поставленные в уровне дважды в одну клетку, рисуются один раз.
+            if xy in drawn_xys:
+                continue
+            drawn_xys.add(xy)
+            # Сложение с пустой поверхностью копирует пиксели, не учитывая общую прозрачность изображения.
+            image.blit(object_._image, xy, special_flags=BLEND_RGBA_ADD)
+        image.set_alpha(objects[0]._image.get_alpha())
+
+        volume: AbstractMapObject = copy(objects[0])
+        volume._rect = Rect(rect)
+        volume._image = image
+        return volume
+
+    def update(self) -> None:
+        self._update_image()
+        if self._is_visible():
+            self._draw()
+
+    def _is_visible(self) -> bool:
+        return self in self._map.grid.visible_objects
 
     def _draw(self) -> None:
-        self._screen.blit(self._image, self._map.camera.apply_rect(self._rect))
+        self._screen.blit(self._image, self._map.camera.apply_xy(self._rect.topleft))
+
+    def draw_on(self, surface: Surface, origin: XYTupleType) -> None:
+        surface.blit(self._image, (self._rect.x - origin[0], self._rect.y - origin[1]))
+
+    def _relocate_in_grid(self) -> None:
+        self._map.grid.relocate(self)
+
+    def _update_z_index_in_grid(self) -> None:
+        self._map.grid.update_z_index(self)
 
     @classmethod
     def reset_class(cls) -> None:
@@ -3,6 +3,7 @@ from pygame import Rect
 from engine.common.singleton import SingletonMeta
 from engine.common.float_rect import FloatRect
 from engine.common.typing_ import SizeTupleType, AnyRectType, XYTupleType, CameraBoundingLinesType
+from engine.fps import get_time_scale
 from engine.screen_access_mixin import ScreenAccessMixin
 
 __all__ = (
@@ -74,8 +75,10 @@ class Camera(ScreenAccessMixin, metaclass=SingletonMeta):
         return self._x_to_move + self._rect.w // 2
 
     def _update_float_xy(self) -> None:
-        x_vel = (self._x_to_move - self._rect.float_x) * self._x_smooth
-        y_vel = (self._y_to_move - self._rect.float_y) * self._y_smooth
+        # Сглаживание за кадр при базовой частоте пересчитывается на длительность шага.
+        time_scale: float = get_time_scale()
+        x_vel = (self._x_to_move - self._rect.float_x) * (1 - (1 - self._x_smooth) ** time_scale)
+        y_vel = (self._y_to_move - self._rect.float_y) * (1 - (1 - self._y_smooth) ** time_scale)
         self._rect.float_x += x_vel
         self._rect.float_y += y_vel
 
@@ -88,8 +91,8 @@ class Camera(ScreenAccessMixin, metaclass=SingletonMeta):
         self._rect.float_x = self._x_to_move
         self._rect.float_y = self._y_to_move
 
-    def apply_rect(self, rect: AnyRectType) -> AnyRectType:
-        rect = rect.copy()
+    def apply_rect(self, rect: AnyRectType) -> Rect:
+        rect = Rect(rect)
         rect.x -= self._rect.x
         rect.y -= self._rect.y
         return rect
@@ -97,6 +100,9 @@ class Camera(ScreenAccessMixin, metaclass=SingletonMeta):
     def apply_xy(self, xy: XYTupleType) -> XYTupleType:
         return xy[0] - self._rect.x, xy[1] - self._rect.y
 
+    def get_rect(self) -> Rect:
+        return self._rect.rect.copy()
+
     @property
     def centerx(self) -> int:
         return self._rect.centerx
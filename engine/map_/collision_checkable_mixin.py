@@ -1,4 +1,9 @@
+from pygame import Rect
+
+from engine.common.float_rect import FloatRect
 from engine.common.typing_ import AnyRectType
+from engine.map_.collision_tilemap import CollisionTilemap
+from engine.map_.swept_collision import ContactTuple, find_earliest_contact, find_shallowest_overlap
 
 __all__ = (
     'CollisionCheckableMixin',
@@ -9,21 +14,63 @@ class CollisionCheckableMixin:
 
     _x_vel: float
     _y_vel: float
-    _rect: AnyRectType
-
-    def _handle_collision_with_bounding_rect(self, bounding_rect: AnyRectType,
-                                             x_vel: float,
-                                             y_vel: float,
-                                             ) -> None:
-        if self._rect.colliderect(bounding_rect):
-            if x_vel > 0:
-                self._handle_right_collision(bounding_rect)
-            elif x_vel < 0:
-                self._handle_left_collision(bounding_rect)
-            elif y_vel > 0:
-                self._handle_bottom_collision(bounding_rect)
-            elif y_vel < 0:
-                self._handle_top_collision(bounding_rect)
+    _rect: FloatRect
+
+    # Сколько раз за перемещение объект может столкнуться с блоками или быть из них вытолкнут.
+    _MAX_SWEEPS_COUNT: int = 4
+
+    def _move_with_collisions(self, dx: float, dy: float, collision_tilemap: CollisionTilemap) -> None:
+        # Проверяется весь путь, поэтому быстрый объект не пролетает сквозь блоки.
+        # После столкновения оставшееся движение вдоль другой оси продолжается, то есть объект скользит по блоку.
+        self._push_out_of_solid_rects(collision_tilemap)
+        target_x: float = self._rect.float_x + dx
+        target_y: float = self._rect.float_y + dy
+        for _ in range(self._MAX_SWEEPS_COUNT):
+            start_rect: Rect = self._rect.rect.copy()
+            self._rect.float_x = target_x
+            self._rect.float_y = target_y
+            moved_x: int = self._rect.x - start_rect.x
+            moved_y: int = self._rect.y - start_rect.y
+            if not moved_x and not moved_y:
+                return
+
+            contact: ContactTuple | None = find_earliest_contact(
+                start_rect, moved_x, moved_y,
+                collision_tilemap.solid_rects_by_rect(start_rect.union(self._rect.rect)),
+            )
+            if contact is None:
+                return
+            if moved_x and moved_y:
+                self._rect.topleft = (
+                    start_rect.x + int(moved_x * contact.time),
+                    start_rect.y + int(moved_y * contact.time),
+                )
+            self._handle_contact(contact)
+            if contact.normal_x:
+                target_x = self._rect.float_x
+            else:
+                target_y = self._rect.float_y
+
+    def _push_out_of_solid_rects(self, collision_tilemap: CollisionTilemap) -> None:
+        # Объект мог оказаться внутри блока, например после выравнивания по краю карты.
+        for _ in range(self._MAX_SWEEPS_COUNT):
+            overlap: ContactTuple | None = find_shallowest_overlap(
+                self._rect.rect,
+                collision_tilemap.solid_rects_by_rect(self._rect.rect),
+            )
+            if overlap is None:
+                return
+            self._handle_contact(overlap)
+
+    def _handle_contact(self, contact: ContactTuple) -> None:
+        if contact.normal_x == -1:
+            self._handle_right_collision(contact.rect)
+        elif contact.normal_x == 1:
+            self._handle_left_collision(contact.rect)
+        elif contact.normal_y == -1:
+            self._handle_bottom_collision(contact.rect)
+        elif contact.normal_y == 1:
+            self._handle_top_collision(contact.rect)
 
     def _handle_right_collision(self, bounding_rect: AnyRectType) -> None:
         self._rect.right = bounding_rect.left
@@ -0,0 +1,74 @@
+from math import ceil
+from pygame import Rect
+
+from engine.common.singleton import SingletonMeta
+from engine.common.typing_ import AnyRectType
+from engine.map_.grid.typing_ import RangesType
+
+__all__ = (
+    'CollisionTilemap',
+)
+
+
+class CollisionTilemap(metaclass=SingletonMeta):
+    """Example:
+    tilemap = CollisionTilemap(tile_side_len=40)
+    tilemap.reset(map_w, map_h)
+    tilemap.add(block.get_rect())
+    for tile_rect in tilemap.solid_rects_by_rect(hero.get_rect()):
+        ...
+    """
+
+    def __init__(self, tile_side_len: int) -> None:
+        self._tile_side_len = tile_side_len
+        self._w: int = 0
+        self._h: int = 0
+        self._tiles: bytearray = bytearray()
+
+    @property
+    def tile_side_len(self) -> int:
+        return self._tile_side_len
+
+    def reset(self, map_w: int, map_h: int) -> None:
+        self._w = ceil(map_w / self._tile_side_len)
+        self._h = ceil(map_h / self._tile_side_len)
+        self._tiles = bytearray(self._w * self._h)
+
+    def add(self, rect: AnyRectType) -> None:
+        self._fill(rect, 1)
+
+    def remove(self, rect: AnyRectType) -> None:
+        self._fill(rect, 0)
+
+    def _fill(self, rect: AnyRectType, value: int) -> None:
+        ranges: RangesType = self._calc_ranges_by_rect(rect)
+        for tile_y in range(*ranges[0]):
+            for tile_x in range(*ranges[1]):
+                self._tiles[tile_y * self._w + tile_x] = value
+
+    def is_solid(self, tile_x: int, tile_y: int) -> bool:
+        if not (0 <= tile_x < self._w and 0 <= tile_y < self._h):
+            return False
+        return bool(self._tiles[tile_y * self._w + tile_x])
+
+    def solid_rects_by_rect(self, rect: AnyRectType) -> list[Rect]:
+        solid_rects: list[Rect] = []
+        ranges: RangesType = self._calc_ranges_by_rect(rect)
+        for tile_y in range(*ranges[0]):
+            row_start: int = tile_y * self._w
+            for tile_x in range(*ranges[1]):
+                if self._tiles[row_start + tile_x]:
+                    solid_rects.append(Rect(
+                        tile_x * self._tile_side_len,
+                        tile_y * self._tile_side_len,
+                        self._tile_side_len,
+                        self._tile_side_len,
+                    ))
+        return solid_rects
+
+    def _calc_ranges_by_rect(self, rect: AnyRectType) -> RangesType:
+        start_tile_x: int = max(rect.left // self._tile_side_len, 0)
+        start_tile_y: int = max(rect.top // self._tile_side_len, 0)
+        end_tile_x: int = min((rect.right - 1) // self._tile_side_len + 1, self._w)
+        end_tile_y: int = min((rect.bottom - 1) // self._tile_side_len + 1, self._h)
+        return (start_tile_y, end_tile_y), (start_tile_x, end_tile_x)
@@ -12,12 +12,17 @@ __all__ = (
 
 
 class AbstractGridObject(AbstractRectangularUI, ABC):
-    _GRID_ATTRS: GridAttrsType = []
+    _Z_INDEX: int = 0
+    _GRID_ATTRS: GridAttrsType = 0
 
     def __init__(self, rect: AnyRectType) -> None:
         super().__init__(rect=rect)
         self._to_delete: bool = False
 
+    @property
+    def z_index(self) -> int:
+        return self._Z_INDEX
+
     @property
     def to_delete(self) -> bool:
         return self._to_delete
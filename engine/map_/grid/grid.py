@@ -1,9 +1,11 @@
 from math import ceil
+from bisect import insort
+from pygame import Rect
 
 from engine.common.singleton import SingletonMeta
 from engine.map_.camera import Camera
 from engine.map_.grid.abstract_grid_object import AnyGridObjectType
-from engine.map_.grid.typing_ import RangesType
+from engine.map_.grid.typing_ import RangesType, GridAttrsType
 from engine.screen_access_mixin import ScreenAccessMixin
 
 __all__ = (
@@ -13,13 +15,31 @@ __all__ = (
 
 class Grid(ScreenAccessMixin, metaclass=SingletonMeta):
 
-    def __init__(self, camera: Camera) -> None:
+    def __init__(self, camera: Camera,
+                 cell_side_len: int | None = None,
+                 visible_area_margin: int = 0,
+                 simulated_area_margin: int = 0,
+                 ) -> None:
         super().__init__()
         self._camera = camera
 
-        self._cell_side_len = self._screen.get_width()
-        self._visible_objects: list[AnyGridObjectType] = []
-        self._grid: list[list[list[AnyGridObjectType]]] = []
+        if cell_side_len is None:
+            cell_side_len = self._screen.get_width()
+        self._cell_side_len = cell_side_len
+        self._visible_area_margin = visible_area_margin
+        # Видимые объекты всегда должны обновляться, поэтому область симуляции не меньше видимой.
+        self._simulated_area_margin = max(simulated_area_margin, visible_area_margin)
+
+        self._visible_objects: set[AnyGridObjectType] = set()
+        self._visible_objects_by_attrs: dict[GridAttrsType, set[AnyGridObjectType]] = {}
+        self._simulated_objects: set[AnyGridObjectType] = set()
+        self._simulated_objects_by_z_indexes: dict[int, set[AnyGridObjectType]] = {}
+        self._sorted_z_indexes: list[int] = []
+        self._grid: list[list[set[AnyGridObjectType]]] = []
+        self._objects_ranges: dict[AnyGridObjectType, RangesType] = {}
+        self._objects_z_indexes: dict[AnyGridObjectType, int] = {}
+        self._visible_ranges: RangesType | None = None
+        self._simulated_ranges: RangesType | None = None
 
     @property
     def w(self) -> int:
@@ -30,11 +50,34 @@ class Grid(ScreenAccessMixin, metaclass=SingletonMeta):
         return len(self._grid)
 
     @property
-    def visible_objects(self) -> list[AnyGridObjectType]:
+    def objects_count(self) -> int:
+        return len(self._objects_ranges)
+
+    @property
+    def visible_objects(self) -> set[AnyGridObjectType]:
         return self._visible_objects
 
+    @property
+    def simulated_objects(self) -> set[AnyGridObjectType]:
+        return self._simulated_objects
+
+    def sorted_simulated_objects(self) -> list[AnyGridObjectType]:
+        sorted_objects: list[AnyGridObjectType] = []
+        for z_index in self._sorted_z_indexes:
+            sorted_objects.extend(self._simulated_objects_by_z_indexes[z_index])
+        return sorted_objects
+
     def reset(self, map_w: int, map_h: int) -> None:
         self._grid.clear()
+        self._visible_objects.clear()
+        self._visible_objects_by_attrs.clear()
+        self._simulated_objects.clear()
+        self._simulated_objects_by_z_indexes.clear()
+        self._sorted_z_indexes.clear()
+        self._objects_ranges.clear()
+        self._objects_z_indexes.clear()
+        self._visible_ranges = None
+        self._simulated_ranges = None
         self._build_cells(
             self._divide(map_w, ceil_=True),
             self._divide(map_h, ceil_=True),
@@ -44,7 +87,7 @@ class Grid(ScreenAccessMixin, metaclass=SingletonMeta):
         for _ in range(h):
             self._grid.append([])
             for _ in range(w):
-                self._grid[-1].append([])
+                self._grid[-1].append(set())
 
     def _divide(self, n: int, ceil_: bool = False) -> int:
         r: float = n / self._cell_side_len
@@ -53,60 +96,173 @@ class Grid(ScreenAccessMixin, metaclass=SingletonMeta):
         return int(r)
 
     def add(self, object_: AnyGridObjectType) -> None:
-        y: int = self._divide(object_.y)
-        x: int = self._divide(object_.x)
-        if y < 0:
-            y = 0
-        elif y > self.h - 1:
-            y = self.h - 1
-        if x < 0:
-            x = 0
-        elif x > self.w - 1:
-            x = self.w - 1
-        self._grid[y][x].append(object_)
+        ranges: RangesType = self._calc_ranges_by_rect(object_.get_rect())
+        self._objects_ranges[object_] = ranges
+        self._objects_z_indexes[object_] = object_.z_index
+        self._add_to_cells(object_, ranges)
+        self._update_membership(object_, ranges)
 
-    def update(self) -> None:
-        ranges: RangesType = self._calc_ranges()
-        self._visible_objects.clear()
+    def remove(self, object_: AnyGridObjectType) -> None:
+        ranges: RangesType | None = self._objects_ranges.pop(object_, None)
+        if ranges is None:
+            return
+        self._remove_from_cells(object_, ranges)
+        self._discard_from_visible(object_)
+        self._discard_from_simulated(object_)
+        del self._objects_z_indexes[object_]
+
+    def relocate(self, object_: AnyGridObjectType) -> None:
+        old_ranges: RangesType | None = self._objects_ranges.get(object_)
+        if old_ranges is None:
+            return
+        new_ranges: RangesType = self._calc_ranges_by_rect(object_.get_rect())
+        if new_ranges == old_ranges:
+            return
+
+        self._remove_from_cells(object_, old_ranges)
+        self._add_to_cells(object_, new_ranges)
+        self._objects_ranges[object_] = new_ranges
+        self._update_membership(object_, new_ranges)
+
+    def update_z_index(self, object_: AnyGridObjectType) -> None:
+        old_z_index: int | None = self._objects_z_indexes.get(object_)
+        if old_z_index is None or old_z_index == object_.z_index:
+            return
+        is_simulated: bool = object_ in self._simulated_objects
+        if is_simulated:
+            self._discard_from_simulated(object_)
+        self._objects_z_indexes[object_] = object_.z_index
+        if is_simulated:
+            self._add_to_simulated(object_)
+
+    def _add_to_cells(self, object_: AnyGridObjectType, ranges: RangesType) -> None:
         for cur_cell_y in range(*ranges[0]):
             for cur_cell_x in range(*ranges[1]):
-                self._update_objects(self._grid[cur_cell_y][cur_cell_x])
-        self._visible_objects = list(set(self._visible_objects))
-
-    def _calc_ranges(self) -> RangesType:
-        start_cell_x: int = self._divide(self._camera.centerx)
-        start_cell_y: int = self._divide(self._camera.centery)
-        end_cell_x: int = start_cell_x
-        end_cell_y: int = start_cell_y
-        if start_cell_x != 0:
-            start_cell_x -= 1
-        if start_cell_y != 0:
-            start_cell_y -= 1
-        if end_cell_x != self.w - 1:
-            end_cell_x += 1
-        if end_cell_y != self.h - 1:
-            end_cell_y += 1
-        return (start_cell_y, end_cell_y + 1), (start_cell_x, end_cell_x + 1)
+                self._grid[cur_cell_y][cur_cell_x].add(object_)
+
+    def _remove_from_cells(self, object_: AnyGridObjectType, ranges: RangesType) -> None:
+        for cur_cell_y in range(*ranges[0]):
+            for cur_cell_x in range(*ranges[1]):
+                self._grid[cur_cell_y][cur_cell_x].discard(object_)
+
+    def _update_membership(self, object_: AnyGridObjectType, ranges: RangesType) -> None:
+        if self._ranges_intersect(ranges, self._visible_ranges):
+            self._add_to_visible(object_)
+        else:
+            self._discard_from_visible(object_)
+
+        if self._ranges_intersect(ranges, self._simulated_ranges):
+            self._add_to_simulated(object_)
+        else:
+            self._discard_from_simulated(object_)
+
+    def _add_to_visible(self, object_: AnyGridObjectType) -> None:
+        self._visible_objects.add(object_)
+        for attr in self._split_attrs(object_.grid_attrs):
+            self._visible_objects_by_attrs.setdefault(attr, set()).add(object_)
 
-    def _update_objects(self, objects: list[AnyGridObjectType]) -> None:
-        for object_ in objects[:]:
-            objects.remove(object_)
-            if not object_.to_delete:
-                self.add(object_)
-                self._visible_objects.append(object_)
+    def _discard_from_visible(self, object_: AnyGridObjectType) -> None:
+        self._visible_objects.discard(object_)
+        for attr in self._split_attrs(object_.grid_attrs):
+            self._visible_objects_by_attrs.get(attr, set()).discard(object_)
 
-    def visible_by_attrs(self, desired_attrs: list[int]) -> list[AnyGridObjectType]:
-        desired_objects: list[AnyGridObjectType] = []
+    def _add_to_simulated(self, object_: AnyGridObjectType) -> None:
+        self._simulated_objects.add(object_)
+        z_index: int = self._objects_z_indexes[object_]
+        if z_index not in self._simulated_objects_by_z_indexes:
+            self._simulated_objects_by_z_indexes[z_index] = set()
+            insort(self._sorted_z_indexes, z_index)
+        self._simulated_objects_by_z_indexes[z_index].add(object_)
+
+    def _discard_from_simulated(self, object_: AnyGridObjectType) -> None:
+        if object_ not in self._simulated_objects:
+            return
+        self._simulated_objects.discard(object_)
+        self._simulated_objects_by_z_indexes[self._objects_z_indexes[object_]].discard(object_)
+
+    @staticmethod
+    def _split_attrs(attrs: GridAttrsType) -> list[GridAttrsType]:
+        single_attrs: list[GridAttrsType] = []
+        while attrs:
+            # Младший установленный бит.
+            attr: GridAttrsType = attrs & -attrs
+            single_attrs.append(attr)
+            attrs ^= attr
+        return single_attrs
+
+    @staticmethod
+    def _ranges_intersect(ranges: RangesType, other_ranges: RangesType | None) -> bool:
+        if other_ranges is None:
+            return False
+        return (ranges[0][0] < other_ranges[0][1] and other_ranges[0][0] < ranges[0][1]
+                and ranges[1][0] < other_ranges[1][1] and other_ranges[1][0] < ranges[1][1])
+
+    def update(self) -> None:
+        visible_ranges: RangesType = self._calc_ranges(self._visible_area_margin)
+        if visible_ranges != self._visible_ranges:
+            self._visible_ranges = visible_ranges
+            self._collect_visible_objects()
+
+        simulated_ranges: RangesType = self._calc_ranges(self._simulated_area_margin)
+        if simulated_ranges != self._simulated_ranges:
+            self._simulated_ranges = simulated_ranges
+            self._collect_simulated_objects()
+
+    def _collect_visible_objects(self) -> None:
+        self._visible_objects_by_attrs.clear()
+        self._collect_objects(self._visible_objects, self._visible_ranges)
         for object_ in self._visible_objects:
-            if self._attrs_is_exist(object_.grid_attrs, desired_attrs):
-                desired_objects.append(object_)
-        return desired_objects
+            for attr in self._split_attrs(object_.grid_attrs):
+                self._visible_objects_by_attrs.setdefault(attr, set()).add(object_)
+
+    def _collect_simulated_objects(self) -> None:
+        for objects in self._simulated_objects_by_z_indexes.values():
+            objects.clear()
+        self._collect_objects(self._simulated_objects, self._simulated_ranges)
+        for object_ in self._simulated_objects:
+            self._add_to_simulated(object_)
+
+    def _collect_objects(self, objects: set[AnyGridObjectType], ranges: RangesType) -> None:
+        objects.clear()
+        for cur_cell_y in range(*ranges[0]):
+            for cur_cell_x in range(*ranges[1]):
+                objects.update(self._grid[cur_cell_y][cur_cell_x])
+
+    def objects_by_rect(self, rect: Rect) -> set[AnyGridObjectType]:
+        # Объекты из ячеек, которые задевает прямоугольник, т.е. не только пересекающиеся с ним.
+        objects: set[AnyGridObjectType] = set()
+        self._collect_objects(objects, self._calc_ranges_by_rect(rect))
+        return objects
+
+    def _calc_ranges(self, margin: int) -> RangesType:
+        return self._calc_ranges_by_rect(self._camera.get_rect().inflate(margin * 2, margin * 2))
+
+    def _calc_ranges_by_rect(self, rect: Rect) -> RangesType:
+        start_cell_x: int = self._clamp(self._divide(rect.left), self.w)
+        start_cell_y: int = self._clamp(self._divide(rect.top), self.h)
+        end_cell_x: int = self._clamp(self._divide(max(rect.left, rect.right - 1)), self.w)
+        end_cell_y: int = self._clamp(self._divide(max(rect.top, rect.bottom - 1)), self.h)
+        return (start_cell_y, end_cell_y + 1), (start_cell_x, end_cell_x + 1)
 
     @staticmethod
-    def _attrs_is_exist(attrs: list[int],
-                        desired_attrs: list[int],
-                        ) -> bool:
-        for desired_attr in desired_attrs:
-            if desired_attr not in attrs:
-                return False
-        return True
+    def _clamp(cell_index: int, cells_count: int) -> int:
+        if cell_index < 0:
+            return 0
+        if cell_index > cells_count - 1:
+            return cells_count - 1
+        return cell_index
+
+    def visible_by_attrs(self, desired_attrs: GridAttrsType) -> list[AnyGridObjectType]:
+        buckets: list[set[AnyGridObjectType]] = [
+            self._visible_objects_by_attrs.get(attr, set()) for attr in self._split_attrs(desired_attrs)
+        ]
+        if not buckets:
+            return list(self._visible_objects)
+
+        smallest_bucket: set[AnyGridObjectType] = min(buckets, key=len)
+        if len(buckets) == 1:
+            return list(smallest_bucket)
+        return [
+            object_ for object_ in smallest_bucket
+            if object_.grid_attrs & desired_attrs == desired_attrs
+        ]
@@ -6,4 +6,4 @@ __all__ = (
 )
 
 RangesType: TypeAlias = tuple[tuple[int, int], tuple[int, int]]
-GridAttrsType: TypeAlias = list[int]
+GridAttrsType: TypeAlias = int
@@ -1,35 +1,48 @@
-from typing import Callable, TypeVar, Generic
+from typing import Callable, TypeVar, TypeAlias, Generic
+from pygame import Rect
 
 from engine.common.singleton import SingletonMeta
 from engine.exceptions import MapObjectCannotBeCreated, PlayerWasNotCreated
 from engine.screen_access_mixin import ScreenAccessMixin
+from engine.lazy_assets import LazyAsset, collect_lazy_assets
 from engine.levels.manager import LevelsManager
 from engine.levels.object_data_tuple import LevelObjectDataTuple
 from engine.levels.level import Level
 from engine.map_.camera import Camera
 from engine.map_.grid.grid import Grid
+from engine.map_.collision_tilemap import CollisionTilemap
+from engine.map_.rects_merging import merge_adjacent_rects
 
 __all__ = (
     'Map',
 )
 
 PlayerType = TypeVar('PlayerType', bound='AbstractMapObject')
+StaticChunkKeyType: TypeAlias = tuple[int, int, int]
 
 
 class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
 
     _objects_types: dict[str, type['AbstractMapObject']] = {}
+    # Запас на перемещение объектов за кадр, пока окрестность игрока не обновлялась.
+    _OBJECTS_NEAR_PLAYER_MARGIN: int = 40
     _current_level: Level
 
     def __init__(self, camera: Camera,
                  grid: Grid,
+                 collision_tilemap: CollisionTilemap,
                  levels_manager: LevelsManager,
+                 static_chunk_side_len: int = 512,
                  ) -> None:
         self._camera = camera
         self._grid = grid
+        self._collision_tilemap = collision_tilemap
         self._levels_manager = levels_manager
+        self._static_chunk_side_len = static_chunk_side_len
+        self._static_chunks: dict[StaticChunkKeyType, StaticChunk] = {}
         self._is_completed: bool = False
         self._player: PlayerType | None = None
+        self._objects_near_player: set[AbstractMapObject] = set()
 
     @property
     def camera(self) -> Camera:
@@ -39,6 +52,10 @@ class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
     def grid(self) -> Grid:
         return self._grid
 
+    @property
+    def collision_tilemap(self) -> CollisionTilemap:
+        return self._collision_tilemap
+
     @property
     def levels_manager(self) -> LevelsManager:
         return self._levels_manager
@@ -56,11 +73,19 @@ class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
         cls._objects_types[type_.__name__] = type_
         return type_
 
+    @classmethod
+    def collect_level_assets(cls, level: Level) -> list[LazyAsset]:
+        # Ресурсы только тех типов объектов, которые есть на уровне.
+        types_names: set[str] = {object_data.type for object_data in level.objects}
+        return collect_lazy_assets(*(cls._objects_types[name] for name in types_names if name in cls._objects_types))
+
     def reset(self) -> None:
         self._is_completed = False
         self._player = None
+        self._objects_near_player = set()
         self._current_level = self._levels_manager.current_level
         self._reset_objects_types()
+        self._reset_collision_tilemap()
         self._reset_grid()
         if self._player is None:
             raise PlayerWasNotCreated
@@ -78,20 +103,89 @@ class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
         )
         self._camera.move_quick(central_rect=self._player.get_rect())
 
+    def _reset_collision_tilemap(self) -> None:
+        self._collision_tilemap.reset(
+            self._levels_manager.current_level.w,
+            self._levels_manager.current_level.h,
+        )
+
     def _reset_grid(self) -> None:
         self._grid.reset(
             self._levels_manager.current_level.w,
             self._levels_manager.current_level.h,
         )
+        self._static_chunks.clear()
+        mergeable_objects: dict[type[AbstractMapObject], list[AbstractMapObject]] = {}
         for object_data in self._current_level.objects:
-            self._add_object(object_data)
-
-    def _add_object(self, object_data: LevelObjectDataTuple) -> None:
-        try:
-            object_ = self._new_object(object_data)
-        except MapObjectCannotBeCreated:
-            return
-        self._grid.add(object_)
+            try:
+                object_ = self._new_object(object_data)
+            except MapObjectCannotBeCreated:
+                continue
+            if object_.is_mergeable:
+                mergeable_objects.setdefault(type(object_), []).append(object_)
+            else:
+                self._add_object(object_)
+        for type_, objects in mergeable_objects.items():
+            self._add_merged_objects(type_, objects)
+
+    def _add_merged_objects(self, type_: type['AbstractMapObject'], objects: list['AbstractMapObject']) -> None:
+        for merged_rect in merge_adjacent_rects([object_.get_rect() for object_ in objects]):
+            self._add_object(type_.merge([objects[index] for index in merged_rect.indexes], merged_rect.rect))
+
+    def _add_object(self, object_: 'AbstractMapObject') -> None:
+        if object_.is_static:
+            self._add_static_object(object_)
+        else:
+            self._grid.add(object_)
+        if object_.is_solid:
+            self._collision_tilemap.add(object_.get_rect())
+
+    def _add_static_object(self, object_: 'AbstractMapObject') -> None:
+        for chunk_key in self._calc_static_chunks_keys(object_):
+            chunk: StaticChunk | None = self._static_chunks.get(chunk_key)
+            if chunk is None:
+                chunk = self._new_static_chunk(chunk_key)
+                self._static_chunks[chunk_key] = chunk
+                self._grid.add(chunk)
+            chunk.add(object_)
+
+    def remove_static_object(self, object_: 'AbstractMapObject') -> None:
+        for chunk_key in self._calc_static_chunks_keys(object_):
+            chunk: StaticChunk | None = self._static_chunks.get(chunk_key)
+            if chunk is None:
+                continue
+            chunk.remove(object_)
+            if chunk.is_empty:
+                self._grid.remove(chunk)
+                del self._static_chunks[chunk_key]
+        if object_.is_solid:
+            self._collision_tilemap.remove(object_.get_rect())
+
+    def _calc_static_chunks_keys(self, object_: 'AbstractMapObject') -> list[StaticChunkKeyType]:
+        rect: Rect = object_.get_rect()
+        start_chunk_x: int = rect.left // self._static_chunk_side_len
+        start_chunk_y: int = rect.top // self._static_chunk_side_len
+        end_chunk_x: int = (rect.right - 1) // self._static_chunk_side_len
+        end_chunk_y: int = (rect.bottom - 1) // self._static_chunk_side_len
+        return [
+            (object_.z_index, chunk_y, chunk_x)
+            for chunk_y in range(start_chunk_y, end_chunk_y + 1)
+            for chunk_x in range(start_chunk_x, end_chunk_x + 1)
+        ]
+
+    def _new_static_chunk(self, chunk_key: StaticChunkKeyType) -> 'StaticChunk':
+        z_index, chunk_y, chunk_x = chunk_key
+        rect: Rect = Rect(
+            chunk_x * self._static_chunk_side_len,
+            chunk_y * self._static_chunk_side_len,
+            self._static_chunk_side_len,
+            self._static_chunk_side_len,
+        )
+        return StaticChunk(
+            map_=self,
+            rect=rect.clip(0, 0, self._current_level.w, self._current_level.h),
+            z_index=z_index,
+        )
 
     def _new_object(self, object_data: LevelObjectDataTuple) -> 'AbstractMapObject':
         object_type: type[AbstractMapObject] = self._objects_types[object_data.type]
@@ -101,14 +195,25 @@ class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
     def set_player(self, player: PlayerType) -> None:
         self._player = player
 
+    def update_objects_near_player(self) -> None:
+        near_rect: Rect = self._player.get_rect().inflate(
+            self._OBJECTS_NEAR_PLAYER_MARGIN * 2,
+            self._OBJECTS_NEAR_PLAYER_MARGIN * 2,
+        )
+        self._objects_near_player = self._grid.objects_by_rect(near_rect)
+
+    def is_near_player(self, object_: 'AbstractMapObject') -> bool:
+        # Столкновение с игроком стоит проверять только у этих объектов.
+        return object_ in self._objects_near_player
+
     def update(self) -> None:
         self._camera.update(central_rect=self._player.get_rect())
         self._grid.update()
-        for object_ in self._sorted_visible_objects():
+        self.update_objects_near_player()
+        for object_ in self._grid.sorted_simulated_objects():
             object_.update()
-
-    def _sorted_visible_objects(self) -> list['AbstractMapObject']:
-        return sorted(self._grid.visible_objects, key=lambda x: x.z_index)
+            if object_.to_delete:
+                self._grid.remove(object_)
 
     def finish(self) -> None:
         self._levels_manager.set_current_as_completed()
@@ -116,3 +221,4 @@ class Map(Generic[PlayerType], ScreenAccessMixin, metaclass=SingletonMeta):
 
 
 from engine.map_.abstract_map_object import AbstractMapObject
+from engine.map_.static_chunk import StaticChunk
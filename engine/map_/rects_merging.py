@@ -0,0 +1,60 @@
+from typing import NamedTuple
+from pygame import Rect
+
+from engine.common.typing_ import AnyRectType
+
+__all__ = (
+    'MergedRectTuple',
+    'merge_adjacent_rects',
+)
+
+
+class MergedRectTuple(NamedTuple):
+
+    rect: Rect
+    # Индексы исходных прямоугольников, из которых составлен этот.
+    indexes: list[int]
+
+
+def merge_adjacent_rects(rects: list[AnyRectType]) -> list[MergedRectTuple]:
+    """Example:
+    # Два ряда по три плитки -> один прямоугольник 120x80 из плиток с индексами 0-5.
+    merge_adjacent_rects([Rect(x, y, 40, 40) for x in (0, 40, 80) for y in (0, 40)])
+    """
+    # Сначала плитки одной строки склеиваются в отрезки, затем одинаковые отрезки соседних строк - в прямоугольники.
+    # Итоговые прямоугольники покрывают ровно те же точки, что и исходные.
+    rows: dict[tuple[int, int], list[int]] = {}
+    for index, rect in enumerate(rects):
+        rows.setdefault((rect.top, rect.height), []).append(index)
+
+    runs: list[MergedRectTuple] = []
+    for row_indexes in rows.values():
+        row_indexes.sort(key=lambda index: rects[index].left)
+        run: MergedRectTuple = MergedRectTuple(Rect(rects[row_indexes[0]]), [row_indexes[0]])
+        for index in row_indexes[1:]:
+            rect: AnyRectType = rects[index]
+            if rect.left <= run.rect.right:
+                run.rect.width = max(run.rect.right, rect.right) - run.rect.left
+                run.indexes.append(index)
+            else:
+                runs.append(run)
+                run = MergedRectTuple(Rect(rect), [index])
+        runs.append(run)
+
+    columns: dict[tuple[int, int], list[MergedRectTuple]] = {}
+    for run in runs:
+        columns.setdefault((run.rect.left, run.rect.width), []).append(run)
+
+    merged_rects: list[MergedRectTuple] = []
+    for column_runs in columns.values():
+        column_runs.sort(key=lambda run: run.rect.top)
+        merged: MergedRectTuple = column_runs[0]
+        for run in column_runs[1:]:
+            if run.rect.top == merged.rect.bottom:
+                merged.rect.height += run.rect.height
+                merged.indexes.extend(run.indexes)
+            else:
+                merged_rects.append(merged)
+                merged = run
+        merged_rects.append(merged)
+    return merged_rects
@@ -0,0 +1,46 @@
+from pygame import Surface, SRCALPHA, RLEACCEL, Rect
+
+from engine.map_.abstract_map_object import AbstractMapObject
+
+__all__ = (
+    'StaticChunk',
+)
+
+
+class StaticChunk(AbstractMapObject):
+
+    def __init__(self, map_: 'Map',
+                 rect: Rect,
+                 z_index: int,
+                 ) -> None:
+        super().__init__(map_=map_, rect=rect)
+        self._z_index = z_index
+        self._objects: list[AbstractMapObject] = []
+        self._image = Surface(self._rect.size, SRCALPHA).convert_alpha()
+        # Запечённый слой почти не меняется и состоит из полностью прозрачных и непрозрачных участков,
+        # поэтому RLE-кодирование многократно ускоряет его отрисовку.
+        self._image.set_alpha(255, RLEACCEL)
+
+    @property
+    def z_index(self) -> int:
+        return self._z_index
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._objects
+
+    def add(self, object_: AbstractMapObject) -> None:
+        self._objects.append(object_)
+        object_.draw_on(self._image, self._rect.topleft)
+
+    def remove(self, object_: AbstractMapObject) -> None:
+        self._objects.remove(object_)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._image.fill((0, 0, 0, 0))
+        for object_ in self._objects:
+            object_.draw_on(self._image, self._rect.topleft)
+
+
+from engine.map_.map_ import Map
@@ -0,0 +1,85 @@
+from math import inf
+from typing import Iterable, NamedTuple
+
+from engine.common.typing_ import AnyRectType
+
+__all__ = (
+    'ContactTuple',
+    'find_earliest_contact',
+    'find_shallowest_overlap',
+)
+
+
+class ContactTuple(NamedTuple):
+
+    # Доля перемещения (от 0 до 1), после которой прямоугольник начинает пересекаться с препятствием.
+    time: float
+    # Сторона препятствия, которой коснулся прямоугольник: (-1, 0) - левая, (0, 1) - нижняя и т.д.
+    normal_x: int
+    normal_y: int
+    rect: AnyRectType
+
+
+def find_earliest_contact(rect: AnyRectType,
+                          dx: int, dy: int,
+                          obstacles: Iterable[AnyRectType],
+                          ) -> ContactTuple | None:
+    """Example:
+    moved_rect = rect.move(dx, dy)
+    obstacles = tilemap.solid_rects_by_rect(rect.union(moved_rect))
+    contact = find_earliest_contact(rect, dx, dy, obstacles)
+    if contact is not None and contact.normal_x == -1:
+        moved_rect.right = contact.rect.left
+    """
+    # Касание без пересечения, как и в 'Rect.colliderect', столкновением не считается,
+    # а препятствия, с которыми прямоугольник пересекается уже в начале, пропускаются.
+    earliest: ContactTuple | None = None
+    for obstacle in obstacles:
+        entry_x, exit_x = _calc_axis_overlap_times(rect.left, rect.right, obstacle.left, obstacle.right, dx)
+        entry_y, exit_y = _calc_axis_overlap_times(rect.top, rect.bottom, obstacle.top, obstacle.bottom, dy)
+        entry: float = max(entry_x, entry_y)
+        if entry < 0 or entry >= 1 or entry >= min(exit_x, exit_y):
+            continue
+        if earliest is not None and entry >= earliest.time:
+            continue
+        if entry_x >= entry_y:
+            earliest = ContactTuple(entry, -1 if dx > 0 else 1, 0, obstacle)
+        else:
+            earliest = ContactTuple(entry, 0, -1 if dy > 0 else 1, obstacle)
+    return earliest
+
+
+def find_shallowest_overlap(rect: AnyRectType,
+                            obstacles: Iterable[AnyRectType],
+                            ) -> ContactTuple | None:
+    # Из пересечений выбирается то, из которого прямоугольник выталкивается на наименьшее расстояние.
+    # Нормаль указывает сторону препятствия, к которой его нужно вытолкнуть.
+    shallowest: ContactTuple | None = None
+    shallowest_depth: int = 0
+    for obstacle in obstacles:
+        if not rect.colliderect(obstacle):
+            continue
+        for depth, normal_x, normal_y in (
+            (rect.right - obstacle.left, -1, 0),
+            (obstacle.right - rect.left, 1, 0),
+            (rect.bottom - obstacle.top, 0, -1),
+            (obstacle.bottom - rect.top, 0, 1),
+        ):
+            if shallowest is None or depth < shallowest_depth:
+                shallowest = ContactTuple(0, normal_x, normal_y, obstacle)
+                shallowest_depth = depth
+    return shallowest
+
+
+def _calc_axis_overlap_times(start: int, end: int,
+                             obstacle_start: int, obstacle_end: int,
+                             delta: int,
+                             ) -> tuple[float, float]:
+    if delta == 0:
+        # Без движения по оси пересечение по ней либо есть всё время, либо его нет никогда.
+        if start < obstacle_end and obstacle_start < end:
+            return -inf, inf
+        return inf, -inf
+    if delta > 0:
+        return (obstacle_start - end) / delta, (obstacle_end - start) / delta
+    return (obstacle_end - start) / delta, (obstacle_start - end) / delta
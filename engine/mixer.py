@@ -0,0 +1,14 @@
+from pygame.mixer import init as init_mixer, get_init as get_mixer_init, set_num_channels
+
+__all__ = (
+    'init_mixer_if_need',
+)
+
+# Постоянный набор каналов для звуков; музыка играет отдельным потоком и каналы не занимает.
+_CHANNELS_COUNT: int = 8
+
+
+def init_mixer_if_need() -> None:
+    if not get_mixer_init():
+        init_mixer()
+        set_num_channels(_CHANNELS_COUNT)
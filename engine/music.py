@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from pygame.mixer import get_init as get_mixer_init, music
+
+from engine.common.singleton import SingletonMeta
+from engine.headless import is_headless
+from engine.mixer import init_mixer_if_need
+
+__all__ = (
+    'MusicPlayer',
+)
+
+
+# Музыка читается из файла по частям во время воспроизведения, а не декодируется в память целиком.
+class MusicPlayer(metaclass=SingletonMeta):
+    """Example:
+    MusicPlayer().play(Path('../assets/sounds/level.ogg'))
+    ...
+    MusicPlayer().update()  # Каждый кадр, пока затухает предыдущая музыка.
+    """
+
+    # Поток музыки в pygame один, поэтому старая музыка сначала затухает, а новая затем нарастает.
+    _DEFAULT_FADE_MS: int = 500
+
+    def __init__(self) -> None:
+        self._current_path: Path | None = None
+        # Музыка, которая начнётся, когда затухнет текущая.
+        self._pending: tuple[Path, int, int] | None = None
+
+    @property
+    def current_path(self) -> Path | None:
+        return self._current_path
+
+    def play(self, path: Path, loops: int = -1, fade_ms: int | None = None) -> None:
+        if path == self._current_path:
+            return
+        self._current_path = path
+        if is_headless():
+            return
+        if fade_ms is None:
+            fade_ms = self._DEFAULT_FADE_MS
+        init_mixer_if_need()
+        if music.get_busy():
+            music.fadeout(fade_ms)
+            self._pending = (path, loops, fade_ms)
+        else:
+            self._start(path, loops, fade_ms)
+
+    def stop(self, fade_ms: int | None = None) -> None:
+        self._current_path = None
+        self._pending = None
+        if is_headless() or not get_mixer_init():
+            return
+        if fade_ms is None:
+            fade_ms = self._DEFAULT_FADE_MS
+        music.fadeout(fade_ms)
+
+    def update(self) -> None:
+        if self._pending is not None and not music.get_busy():
+            self._start(*self._pending)
+
+    def _start(self, path: Path, loops: int, fade_ms: int) -> None:
+        self._pending = None
+        music.load(path)
+        music.play(loops, fade_ms=fade_ms)
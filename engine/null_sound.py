@@ -0,0 +1,28 @@
+__all__ = (
+    'NullSound',
+)
+
+
+# Заглушка 'pygame.mixer.Sound' для режима без звука.
+class NullSound:
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def fadeout(self, time: int) -> None:
+        pass
+
+    def set_volume(self, value: float) -> None:
+        pass
+
+    def get_volume(self) -> float:
+        return 0
+
+    def get_num_channels(self) -> int:
+        return 0
+
+    def get_length(self) -> float:
+        return 0
@@ -1,3 +1,11 @@
+from os import environ
+
+from engine.headless import is_headless
+
+if is_headless():
+    environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
 from pygame import init as init_pygame, Surface, display
 
 __all__ = (
@@ -6,12 +14,19 @@ __all__ = (
 
 init_pygame()
 
+# Размер экрана без окна неизвестен, поэтому берётся типичное соотношение сторон.
+_HEADLESS_ASPECT_RATIO: float = 16 / 9
+
 
 def set_global_screen(h: int,
                       title: str,
                       flags: int,
                       icon: Surface,
                       ) -> None:
+    if is_headless():
+        # Поверхность в памяти вместо окна.
+        display.set_mode(_prepare_window_size(h))
+        return
     display.set_mode(_prepare_window_size(h), flags=flags)
     display.set_caption(title)
     display.set_icon(icon)
@@ -22,5 +37,7 @@ def _prepare_window_size(h: int) -> tuple[int, int]:
 
 
 def _calc_window_w(h: int) -> int:
+    if is_headless():
+        return int(h * _HEADLESS_ASPECT_RATIO)
     screen_info = display.Info()
     return int(h * (screen_info.current_w / screen_info.current_h))
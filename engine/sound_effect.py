@@ -0,0 +1,57 @@
+from time import perf_counter
+
+from pygame.mixer import Sound
+
+from engine.common.typing_ import AnyRectType
+from engine.null_sound import NullSound
+
+__all__ = (
+    'SoundEffect',
+)
+
+
+class SoundEffect:
+    """Example:
+    cannon_sound = SoundEffect(Sound(path), max_voices=2, cooldown=0.1, max_distance=200)
+    cannon_sound.play()
+    # Не звучит, если источник дальше 'max_distance' от области камеры.
+    cannon_sound.play(source_rect=cannon_rect, listener_rect=camera.get_rect())
+    """
+
+    def __init__(self, sound: Sound | NullSound,
+                 max_voices: int = 1,
+                 cooldown: float = 0,
+                 max_distance: int | None = None,
+                 ) -> None:
+        self._sound = sound
+        # Сколько раз звук может звучать одновременно.
+        self._max_voices = max_voices
+        # Минимальный промежуток между запусками в секундах.
+        self._cooldown = cooldown
+        self._max_distance = max_distance
+        self._played_at: float = -cooldown
+
+    @property
+    def sound(self) -> Sound | NullSound:
+        return self._sound
+
+    def play(self, source_rect: AnyRectType | None = None,
+             listener_rect: AnyRectType | None = None,
+             ) -> None:
+        now: float = perf_counter()
+        if now - self._played_at < self._cooldown:
+            return
+        if source_rect is not None and listener_rect is not None and self._is_too_far(source_rect, listener_rect):
+            return
+        if self._sound.get_num_channels() >= self._max_voices:
+            return
+        # Если все каналы заняты, звук просто не запустится.
+        self._sound.play()
+        self._played_at = now
+
+    def _is_too_far(self, source_rect: AnyRectType, listener_rect: AnyRectType) -> bool:
+        if self._max_distance is None:
+            return False
+        x_distance: int = max(listener_rect.left - source_rect.right, source_rect.left - listener_rect.right, 0)
+        y_distance: int = max(listener_rect.top - source_rect.bottom, source_rect.top - listener_rect.bottom, 0)
+        return max(x_distance, y_distance) > self._max_distance
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+from pygame import Surface
+from pygame.font import Font
+
+from engine.common.typing_ import ColorTupleType
+
+__all__ = (
+    'TextRenderer',
+)
+
+_TextKeyType = tuple[str, tuple[int, ...]]
+
+
+# Отрисованные строки кэшируются, поэтому повторный текст не растеризуется заново.
+# Сглаживание не поддерживается: игра использует только пиксельные шрифты.
+class TextRenderer:
+    """Example:
+    renderer = TextRenderer.for_font(PixelFonts.SMALL)
+    # Поверхность из кэша общая, поэтому её нельзя изменять.
+    count_surface = renderer.render('123', Color.WHITE)
+    """
+
+    # Сколько последних строк хранится для каждого шрифта.
+    _TEXTS_CACHE_SIZE: int = 256
+    _renderers: dict[Font, 'TextRenderer'] = {}
+
+    def __init__(self, font: Font) -> None:
+        self._font = font
+        self._texts: OrderedDict[_TextKeyType, Surface] = OrderedDict()
+
+    @classmethod
+    def for_font(cls, font: Font) -> 'TextRenderer':
+        if font not in cls._renderers:
+            cls._renderers[font] = cls(font)
+        return cls._renderers[font]
+
+    def render(self, text: str, color: ColorTupleType) -> Surface:
+        key: _TextKeyType = (text, tuple(color))
+        surface: Surface | None = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            return surface
+        surface = self._font.render(text, 0, color)
+        self._texts[key] = surface
+        if len(self._texts) > self._TEXTS_CACHE_SIZE:
+            self._texts.popitem(last=False)
+        return surface
@@ -0,0 +1,229 @@
+from hashlib import sha1
+from json import dumps, loads, JSONDecodeError
+from os import replace
+from pathlib import Path
+from zlib import compress, decompress, error as ZlibError
+
+from pygame import Surface, SRCALPHA, BLEND_RGBA_ADD
+from pygame.image import tobytes, frombytes
+
+__all__ = (
+    'TextureAtlas',
+    'calc_files_signature',
+    'calc_file_hash',
+)
+
+# Номер страницы, x, y, ширина и высота изображения на ней.
+RegionType = tuple[int, int, int, int, int]
+
+
+def calc_files_signature(paths: list[Path], root_path: Path) -> str:
+    # Изменение, добавление или удаление любого из файлов меняет подпись.
+    hash_ = sha1()
+    for path in paths:
+        stat = path.stat()
+        hash_.update(f'{path.relative_to(root_path).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n'.encode())
+    return hash_.hexdigest()
+
+
+def calc_file_hash(path: Path) -> str:
+    return sha1(path.read_bytes()).hexdigest()
+
+
+class TextureAtlas:
+    """Example:
+    atlas = TextureAtlas.load(folder_path)
+    if atlas.signature != signature:
+        # Изображения изменённых исходников будут созданы заново.
+        atlas.update_sources({'spike': calc_file_hash(spike_path)}, signature)
+    spike_image = atlas.get('spike')
+    if spike_image is None:
+        spike_image = load_spike_image()
+        atlas.add('spike', spike_image, source_key='spike')
+    if atlas.has_unsaved_changes:
+        atlas.save(folder_path)
+    """
+
+    _VERSION: int = 2
+    _PAGE_SIZE: int = 1024
+    # Крупные изображения (например, фоны) занимают отдельную страницу.
+    _MAX_SHARED_IMAGE_SIZE: int = 512
+    # Пиксели хранятся в формате 'Surface(..., SRCALPHA)', поэтому после чтения не конвертируются.
+    _PIXELS_FORMAT: str = 'BGRA'
+    _INDEX_FILENAME: str = 'index.json'
+    _PAGES_FILENAME: str = 'pages.bin'
+
+    def __init__(self, pages: list[Surface | bytes] | None = None,
+                 pages_sizes: list[tuple[int, int]] | None = None,
+                 regions: dict[str, RegionType] | None = None,
+                 entries_sources: dict[str, str] | None = None,
+                 sources_hashes: dict[str, str] | None = None,
+                 signature: str = '',
+                 ) -> None:
+        # Страница хранится сжатой, пока из неё не запросят изображение.
+        self._pages = pages or []
+        self._pages_sizes = pages_sizes or [page.get_size() for page in self._pages]
+        self._regions = regions or {}
+        # Из какого исходного файла получено каждое изображение, и хеши содержимого этих файлов.
+        self._entries_sources = entries_sources or {}
+        self._sources_hashes = sources_hashes or {}
+        self._signature = signature
+        # Изображения, добавленные после загрузки; попадают на страницы при сохранении.
+        self._unpacked_images: dict[str, Surface] = {}
+        self._has_unsaved_changes: bool = False
+
+    @property
+    def signature(self) -> str:
+        return self._signature
+
+    @property
+    def pages_count(self) -> int:
+        return len(self._pages)
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        return self._has_unsaved_changes
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._regions or key in self._unpacked_images
+
+    def get(self, key: str) -> Surface | None:
+        # Подповерхность делит пиксели со страницей, но прозрачность у неё своя.
+        if key in self._unpacked_images:
+            image: Surface = self._unpacked_images[key]
+            return image.subsurface(image.get_rect())
+        if key not in self._regions:
+            return None
+        page_index, x, y, w, h = self._regions[key]
+        page: Surface | None = self._get_page(page_index)
+        if page is None:
+            return None
+        return page.subsurface((x, y, w, h))
+
+    def _get_page(self, page_index: int) -> Surface | None:
+        page: Surface | bytes = self._pages[page_index]
+        if not isinstance(page, bytes):
+            return page
+        try:
+            page = frombytes(decompress(page), self._pages_sizes[page_index], self._PIXELS_FORMAT)
+        except (ZlibError, ValueError):
+            # Изображения с повреждённой страницы создаются заново, как будто их не было в атласе.
+            for key in [key for key, region in self._regions.items() if region[0] == page_index]:
+                del self._regions[key]
+                del self._entries_sources[key]
+            self._has_unsaved_changes = True
+            return None
+        self._pages[page_index] = page
+        return page
+
+    def add(self, key: str, image: Surface, source_key: str) -> None:
+        self._regions.pop(key, None)
+        self._unpacked_images[key] = image
+        self._entries_sources[key] = source_key
+        self._has_unsaved_changes = True
+
+    def update_sources(self, sources_hashes: dict[str, str], signature: str) -> None:
+        # Изображения, исходники которых изменились или удалены, выбрасываются.
+        for key, source_key in list(self._entries_sources.items()):
+            if source_key not in sources_hashes or sources_hashes[source_key] != self._sources_hashes.get(source_key):
+                self._regions.pop(key, None)
+                self._unpacked_images.pop(key, None)
+                del self._entries_sources[key]
+        self._sources_hashes = dict(sources_hashes)
+        self._signature = signature
+        self._has_unsaved_changes = True
+
+    @classmethod
+    def load(cls, folder_path: Path) -> 'TextureAtlas':
+        # Отсутствующий или повреждённый атлас равносилен пустому.
+        try:
+            index: dict = loads(folder_path.joinpath(cls._INDEX_FILENAME).read_text(encoding='utf-8'))
+            if index.get('version') != cls._VERSION:
+                return cls()
+            # Все страницы читаются одним вызовом, а распаковываются по мере надобности.
+            data: bytes = folder_path.joinpath(cls._PAGES_FILENAME).read_bytes()
+            return cls(
+                pages=[data[offset:offset + size] for _, _, offset, size in index['pages']],
+                pages_sizes=[(w, h) for w, h, _, _ in index['pages']],
+                regions={key: tuple(region) for key, region in index['regions'].items()},
+                entries_sources=index['entries_sources'],
+                sources_hashes=index['sources_hashes'],
+                signature=index['signature'],
+            )
+        except (OSError, JSONDecodeError, ValueError, KeyError):
+            return cls()
+
+    def save(self, folder_path: Path) -> None:
+        images: dict[str, Surface] = {}
+        for key in list(self._entries_sources):
+            image: Surface | None = self.get(key)
+            if image is not None:
+                images[key] = image
+        pages, regions = self._pack(images)
+
+        folder_path.mkdir(parents=True, exist_ok=True)
+        index_path: Path = folder_path.joinpath(self._INDEX_FILENAME)
+        # Пока индекса нет, атлас считается пустым, поэтому он удаляется первым и пишется последним.
+        index_path.unlink(missing_ok=True)
+
+        pages_index: list[tuple[int, int, int, int]] = []
+        pages_parts: list[bytes] = []
+        offset: int = 0
+        for page in pages:
+            part: bytes = compress(tobytes(page, self._PIXELS_FORMAT))
+            pages_index.append((*page.get_size(), offset, len(part)))
+            pages_parts.append(part)
+            offset += len(part)
+        self._write_atomically(folder_path.joinpath(self._PAGES_FILENAME), b''.join(pages_parts))
+        self._write_atomically(index_path, dumps({
+            'version': self._VERSION,
+            'signature': self._signature,
+            'pages': pages_index,
+            'regions': regions,
+            'entries_sources': self._entries_sources,
+            'sources_hashes': self._sources_hashes,
+        }).encode('utf-8'))
+        self._has_unsaved_changes = False
+
+    @classmethod
+    def _pack(cls, images: dict[str, Surface]) -> tuple[list[Surface], dict[str, RegionType]]:
+        pages: list[Surface] = []
+        used_heights: list[int] = []
+        regions: dict[str, RegionType] = {}
+        large_images: dict[str, Surface] = {}
+        x, y, shelf_h = 0, 0, 0
+        # Раскладка по полкам: изображения от высоких к низким, слева направо.
+        for key, image in sorted(images.items(), key=lambda item: (-item[1].get_height(), -item[1].get_width(), item[0])):
+            w, h = image.get_size()
+            if w > cls._MAX_SHARED_IMAGE_SIZE or h > cls._MAX_SHARED_IMAGE_SIZE:
+                large_images[key] = image
+                continue
+            if x + w > cls._PAGE_SIZE:
+                x, y, shelf_h = 0, y + shelf_h, 0
+            if not pages or y + h > cls._PAGE_SIZE:
+                pages.append(Surface((cls._PAGE_SIZE, cls._PAGE_SIZE), SRCALPHA))
+                used_heights.append(0)
+                x, y, shelf_h = 0, 0, 0
+            cls._copy_pixels(image, pages[-1], (x, y))
+            regions[key] = (len(pages) - 1, x, y, w, h)
+            used_heights[-1] = max(used_heights[-1], y + h)
+            x += w
+            shelf_h = max(shelf_h, h)
+        pages = [page.subsurface((0, 0, cls._PAGE_SIZE, used_h)).copy() for page, used_h in zip(pages, used_heights)]
+
+        for key, image in large_images.items():
+            pages.append(cls._copy_pixels(image, Surface(image.get_size(), SRCALPHA), (0, 0)))
+            regions[key] = (len(pages) - 1, 0, 0, *image.get_size())
+        return pages, regions
+
+    @staticmethod
+    def _copy_pixels(image: Surface, page: Surface, xy: tuple[int, int]) -> Surface:
+        # Сложение с пустой страницей копирует пиксели без смешивания.
+        page.blit(image, xy, special_flags=BLEND_RGBA_ADD)
+        return page
+
+    @staticmethod
+    def _write_atomically(path: Path, data: bytes) -> None:
+        tmp_path: Path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(data)
+        replace(tmp_path, path)
@@ -5,7 +5,10 @@ from game.config import GameConfig
 if __name__ == '__main__':
     set_coins_count(0)
 
-    levels_manager: LevelsManager = LevelsManager(levels_folder_path=GameConfig.LEVELS_PATH)
+    levels_manager: LevelsManager = LevelsManager(
+        levels_folder_path=GameConfig.LEVELS_PATH,
+        progress_file_path=GameConfig.PROGRESS_PATH,
+    )
     levels_manager.init()
 
     for level in levels_manager.levels:
@@ -0,0 +1,9 @@
+from engine.common.files import del_extension
+from engine.levels.compiled_level import compile_level
+from game.config import GameConfig
+
+if __name__ == '__main__':
+    for json_path in sorted(GameConfig.LEVELS_PATH.iterdir()):
+        compiled_path = GameConfig.COMPILED_LEVELS_PATH.joinpath(del_extension(json_path.name) + '.level')
+        compile_level(json_path, compiled_path)
+        print(f'{json_path.name}: {json_path.stat().st_size} -> {compiled_path.stat().st_size} байт')
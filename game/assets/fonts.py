@@ -1,5 +1,8 @@
+from functools import partial
+
 from pygame.font import Font
 
+from engine.lazy_assets import LazyAsset, LazyAssetsGroup
 from game.config import GameConfig
 
 
@@ -12,8 +15,12 @@ def load_font(size: int, font_name: str = 'pixel') -> Font:
     return Font(GameConfig.FONTS_PATH.joinpath(font_name + '.ttf'), size)
 
 
-class PixelFonts:
-    LARGE = load_font(40)
-    MEDIUM = load_font(30)
-    SMALL = load_font(20)
-    VERY_SMALL = load_font(10)
+def lazy_font(size: int, font_name: str = 'pixel') -> LazyAsset[Font]:
+    return LazyAsset(partial(load_font, size, font_name))
+
+
+class PixelFonts(LazyAssetsGroup):
+    LARGE: LazyAsset[Font] = lazy_font(40)
+    MEDIUM: LazyAsset[Font] = lazy_font(30)
+    SMALL: LazyAsset[Font] = lazy_font(20)
+    VERY_SMALL: LazyAsset[Font] = lazy_font(10)
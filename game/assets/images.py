@@ -1,13 +1,18 @@
 from pygame.image import load as load_
 from pygame import Surface, SRCALPHA
 from pygame.transform import flip
-from pygame.draw import rect as draw_rect
+from pygame.mask import from_surface as mask_from_surface
+from atexit import register as register_at_exit
+from functools import partial
 from os import listdir
 from typing import TypeAlias
 from pathlib import Path
+from traceback import print_exc
 
 from game.config import GameConfig
 from engine.common.colors import Color
+from engine.lazy_assets import LazyAsset, LazyAssetsGroup
+from engine.texture_atlas import TextureAtlas, calc_files_signature, calc_file_hash
 
 __all__ = (
     'ImagesListType',
@@ -41,20 +46,92 @@ __all__ = (
 
 ImagesListType: TypeAlias = list[Surface]
 
+_TRANSPARENT_COLOR: tuple[int, int, int, int] = (0, 0, 0, 0)
 
-def load_image(path: Path, extension: str | None = 'png') -> Surface:
+
+def load_atlas() -> TextureAtlas:
+    paths: list[Path] = sorted(GameConfig.IMAGES_PATH.rglob('*.png'))
+    signature: str = calc_files_signature(paths, GameConfig.IMAGES_PATH)
+    atlas: TextureAtlas = TextureAtlas.load(GameConfig.ATLAS_PATH)
+    if atlas.signature != signature:
+        # Хеши содержимого считаются только при изменении подписи, например после 'git checkout'.
+        atlas.update_sources({make_atlas_key(path): calc_file_hash(path) for path in paths}, signature)
+    return atlas
+
+
+def save_atlas() -> None:
+    # Варианты изображений создаются по мере обращения к ним, поэтому атлас сохраняется при выходе.
+    if not _ATLAS.is_loaded or not _ATLAS.get().has_unsaved_changes:
+        return
+    try:
+        _ATLAS.get().save(GameConfig.ATLAS_PATH)
+    except OSError:
+        # Без сохранённого атласа игра работает, но при следующем запуске соберёт его заново.
+        print_exc()
+
+
+def make_atlas_key(path: Path) -> str:
+    return Path(path).relative_to(GameConfig.IMAGES_PATH).with_suffix('').as_posix()
+
+
+def make_variant_key(source_key: str, flip_x: bool, flip_y: bool, whitewashed: bool) -> str:
+    return source_key + ''.join(
+        '|' + name for name, enabled in (('flip_x', flip_x), ('flip_y', flip_y), ('white', whitewashed)) if enabled
+    )
+
+
+def load_image(path: Path,
+               extension: str | None = 'png',
+               flip_x: bool = False,
+               flip_y: bool = False,
+               whitewashed: bool = False,
+               alpha: int | None = None,
+               ) -> Surface:
     if extension is not None:
-        path: str = str(path) + '.' + extension
-    return optimize(load_(path))
+        path = Path(str(path) + '.' + extension)
+    if Path(path).suffix != '.png':
+        return optimize(load_(path))
+
+    # Отражённые и побелённые варианты хранятся в атласе наравне с исходными изображениями.
+    atlas: TextureAtlas = _ATLAS.get()
+    source_key: str = make_atlas_key(path)
+    key: str = make_variant_key(source_key, flip_x, flip_y, whitewashed)
+    image: Surface | None = atlas.get(key)
+    if image is None:
+        if key == source_key:
+            image = optimize(load_(path))
+        else:
+            image = load_image(path, extension=None)
+            if flip_x or flip_y:
+                image = flip(image, flip_x, flip_y)
+            if whitewashed:
+                image = whitewash(image)
+        atlas.add(key, image, source_key)
+        image = atlas.get(key)
+    # Прозрачность задаётся самой подповерхности и не затрагивает другие изображения с той же картинкой.
+    if alpha is not None:
+        image.set_alpha(alpha)
+    return image
 
 
-def load_images(path: Path) -> ImagesListType:
+def load_images(path: Path,
+                flip_x: bool = False,
+                whitewashed: bool = False,
+                ) -> ImagesListType:
     images: ImagesListType = []
     for filename in sorted(listdir(path), key=get_index_from_filename):
-        images.append(load_image(path.joinpath(filename), extension=None))
+        images.append(load_image(path.joinpath(filename), extension=None, flip_x=flip_x, whitewashed=whitewashed))
     return images
 
 
+def lazy_image(path: Path, **kwargs) -> LazyAsset[Surface]:
+    return LazyAsset(partial(load_image, path, **kwargs))
+
+
+def lazy_images(path: Path, **kwargs) -> LazyAsset[ImagesListType]:
+    return LazyAsset(partial(load_images, path, **kwargs))
+
+
 def get_index_from_filename(filename: str) -> int:
     return int(filename.split('.')[0])
 
@@ -66,163 +143,138 @@ def optimize(image: Surface) -> Surface:
 
 
 def whitewash(image: Surface) -> Surface:
-    image = image.copy()
-    for y in range(image.get_height()):
-        for x in range(image.get_width()):
-            pixel_color = image.get_at((x, y))
-            if pixel_color[3]:
-                draw_rect(image, Color.WHITE, (x, y, 1, 1))
-    return image
+    # Маска отмечает все непрозрачные пиксели, и они целиком закрашиваются белым.
+    whitewashed_image = Surface(image.get_size(), SRCALPHA)
+    mask_from_surface(image, 0).to_surface(whitewashed_image, setcolor=Color.WHITE, unsetcolor=_TRANSPARENT_COLOR)
+    return whitewashed_image
 
 
-def whitewash_many(images: ImagesListType) -> ImagesListType:
-    whitewashed_images: ImagesListType = []
-    for image in images:
-        whitewashed_images.append(whitewash(image))
-    return whitewashed_images
+_ATLAS: LazyAsset[TextureAtlas] = LazyAsset(load_atlas)
+register_at_exit(save_atlas)
 
+ICON_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('icons/icon'), extension='ico')
+SUN_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('sun'))
+FINISH_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('finish'))
+CLOUDS_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('clouds'))
+COIN_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('coin'))
+HEART_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('heart/as_item'))
+LOST_HEART_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('heart/as_item/0'), alpha=100)
+TREES_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('trees'))
+SPIKE_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('spike'))
+HINT_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('hint'))
+LADDER_IMAGE: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('ladder'))
+CHEST_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('chest'))
+SHIELD_IMAGES: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('shield'))
 
-def flip_many(images: ImagesListType,
-              x_bool: bool = True,
-              y_bool: bool = False,
-              ) -> ImagesListType:
-    flipped_images: ImagesListType = []
-    for image in images:
-        flipped_images.append(
-            flip(image, x_bool, y_bool)
-        )
-    return flipped_images
 
-
-ICON_IMAGE: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('icons/icon'), extension='ico')
-SUN_IMAGE: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('sun'))
-FINISH_IMAGE: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('finish'))
-CLOUDS_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('clouds'))
-COIN_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('coin'))
-HEART_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('heart/as_item'))
-LOST_HEART_IMAGE: Surface = HEART_IMAGES[0].copy()
-LOST_HEART_IMAGE.set_alpha(100)
-TREES_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('trees'))
-SPIKE_IMAGE: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('spike'))
-HINT_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('hint'))
-LADDER_IMAGE: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('ladder'))
-CHEST_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('chest'))
-SHIELD_IMAGES: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('shield'))
-
-
-class BackgroundImages:
+class BackgroundImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('backgrounds')
-    HOME: Surface = load_image(__PATH.joinpath('home'))
-    BOTTOM_HOME_BORDER: Surface = load_image(__PATH.joinpath('home_border'))
-    TOP_HOME_BORDER: Surface = flip(BOTTOM_HOME_BORDER, flip_x=False, flip_y=True)
-    MAP: Surface = load_image(__PATH.joinpath('map'))
+    HOME: LazyAsset[Surface] = lazy_image(__PATH.joinpath('home'))
+    BOTTOM_HOME_BORDER: LazyAsset[Surface] = lazy_image(__PATH.joinpath('home_border'))
+    TOP_HOME_BORDER: LazyAsset[Surface] = lazy_image(__PATH.joinpath('home_border'), flip_y=True)
+    MAP: LazyAsset[Surface] = lazy_image(__PATH.joinpath('map'))
 
 
-class DirtImages:
+class DirtImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('dirt')
-    DEFAULT: Surface = load_image(__PATH.joinpath('default'))
-    BACKGROUND: Surface = load_image(__PATH.joinpath('background'))
-    LEFT: Surface = load_image(__PATH.joinpath('left'))
-    RIGHT: Surface = load_image(__PATH.joinpath('right'))
-    GRASS_LIST: ImagesListType = load_images(__PATH.joinpath('grass'))
+    DEFAULT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('default'))
+    BACKGROUND: LazyAsset[Surface] = lazy_image(__PATH.joinpath('background'))
+    LEFT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('left'))
+    RIGHT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('right'))
+    GRASS_LIST: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('grass'))
 
 
-class BricksImages:
+class BricksImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('bricks')
-    DEFAULT: Surface = load_image(__PATH.joinpath('default'))
-    BACKGROUND: Surface = load_image(__PATH.joinpath('background'))
+    DEFAULT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('default'))
+    BACKGROUND: LazyAsset[Surface] = lazy_image(__PATH.joinpath('background'))
 
 
-class PlayerDefaultImages:
+class PlayerDefaultImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('player/default')
-    STAND_RIGHT: ImagesListType = load_images(__PATH.joinpath('stand'))
-    STAND_LEFT: ImagesListType = flip_many(STAND_RIGHT)
-    GO_RIGHT: ImagesListType = load_images(__PATH.joinpath('go'))
-    GO_LEFT: ImagesListType = flip_many(GO_RIGHT)
-    GO_VERTICAL: ImagesListType = load_images(__PATH.joinpath('go_vertical'))
+    STAND_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('stand'))
+    STAND_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('stand'), flip_x=True)
+    GO_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'))
+    GO_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'), flip_x=True)
+    GO_VERTICAL: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go_vertical'))
 
 
-class PlayerDefaultWhiteImages:
+class PlayerDefaultWhiteImages(LazyAssetsGroup):
 
-    STAND_RIGHT: ImagesListType = whitewash_many(PlayerDefaultImages.STAND_RIGHT)
-    STAND_LEFT: ImagesListType = whitewash_many(PlayerDefaultImages.STAND_LEFT)
-    GO_RIGHT: ImagesListType = whitewash_many(PlayerDefaultImages.GO_RIGHT)
-    GO_LEFT: ImagesListType = whitewash_many(PlayerDefaultImages.GO_LEFT)
-    GO_VERTICAL: ImagesListType = whitewash_many(PlayerDefaultImages.GO_VERTICAL)
+    __PATH: Path = GameConfig.IMAGES_PATH.joinpath('player/default')
+    STAND_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('stand'), whitewashed=True)
+    STAND_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('stand'), flip_x=True, whitewashed=True)
+    GO_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'), whitewashed=True)
+    GO_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'), flip_x=True, whitewashed=True)
+    GO_VERTICAL: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go_vertical'), whitewashed=True)
 
 
-class SlugImages:
+class SlugImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('slug')
-    GO: ImagesListType = load_images(__PATH.joinpath('go'))
-    DEATH: ImagesListType = load_images(__PATH.joinpath('death'))
+    GO: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'))
+    DEATH: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('death'))
 
 
-class BatImages:
+class BatImages(LazyAssetsGroup):
 
-    GO_RIGHT: ImagesListType = load_images(GameConfig.IMAGES_PATH.joinpath('bat'))
-    GO_LEFT: ImagesListType = flip_many(GO_RIGHT)
+    GO_RIGHT: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('bat'))
+    GO_LEFT: LazyAsset[ImagesListType] = lazy_images(GameConfig.IMAGES_PATH.joinpath('bat'), flip_x=True)
 
 
-class SkeletonImages:
+class SkeletonImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('skeleton')
-    GO_RIGHT: ImagesListType = load_images(__PATH.joinpath('go'))
-    GO_LEFT: ImagesListType = flip_many(GO_RIGHT)
-    ATTACK_RIGHT: ImagesListType = load_images(__PATH.joinpath('attack'))
-    ATTACK_LEFT: ImagesListType = flip_many(ATTACK_RIGHT)
+    GO_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'))
+    GO_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'), flip_x=True)
+    ATTACK_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('attack'))
+    ATTACK_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('attack'), flip_x=True)
 
 
-class CannonImages:
+class CannonImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('cannon')
-    DEFAULT_RIGHT: Surface = load_image(__PATH.joinpath('cannon/default'))
-    DEFAULT_LEFT: Surface = flip(DEFAULT_RIGHT, flip_x=True, flip_y=False)
-    SHOOT_RIGHT: ImagesListType = load_images(__PATH.joinpath('cannon/shoot'))
-    SHOOT_LEFT: ImagesListType = flip_many(SHOOT_RIGHT)
+    DEFAULT_RIGHT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('cannon/default'))
+    DEFAULT_LEFT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('cannon/default'), flip_x=True)
+    SHOOT_RIGHT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('cannon/shoot'))
+    SHOOT_LEFT: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('cannon/shoot'), flip_x=True)
 
-    class CannonballImages:
+    class CannonballImages(LazyAssetsGroup):
 
         __PATH: Path = GameConfig.IMAGES_PATH.joinpath('cannon/cannonball')
-        DEFAULT: Surface = load_image(__PATH.joinpath('default'))
-        DEATH: ImagesListType = load_images(__PATH.joinpath('death'))
+        DEFAULT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('default'))
+        DEATH: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('death'))
 
 
-class SpiderImages:
+class SpiderImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('spider')
-    STAND: Surface = load_image(__PATH.joinpath('stand'))
-    GO: ImagesListType = load_images(__PATH.joinpath('go'))
+    STAND: LazyAsset[Surface] = lazy_image(__PATH.joinpath('stand'))
+    GO: LazyAsset[ImagesListType] = lazy_images(__PATH.joinpath('go'))
 
 
-class GhostImages:
+class GhostImages(LazyAssetsGroup):
 
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('ghost')
-    GO_LEFT: Surface = load_image(__PATH.joinpath('go'))
-    GO_LEFT.set_alpha(155)
-    GO_RIGHT: Surface = flip(GO_LEFT, flip_x=True, flip_y=False)
-    GO_RIGHT.set_alpha(155)
-    ATTACK_LEFT: Surface = load_image(__PATH.joinpath('attack'))
-    # ATTACK_LEFT.set_alpha(100)
-    ATTACK_RIGHT: Surface = flip(ATTACK_LEFT, flip_x=True, flip_y=False)
-    # ATTACK_RIGHT.set_alpha(100)
+    GO_LEFT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('go'), alpha=155)
+    GO_RIGHT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('go'), flip_x=True, alpha=155)
+    ATTACK_LEFT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('attack'))
+    ATTACK_RIGHT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('attack'), flip_x=True)
 
 
-class WaterImages:
+class WaterImages(LazyAssetsGroup):
 
     ALPHA: int = 225
     __PATH: Path = GameConfig.IMAGES_PATH.joinpath('water')
-    DEFAULT: Surface = load_image(__PATH.joinpath('default'))
-    DEFAULT.set_alpha(ALPHA)
-    TOP: Surface = load_image(__PATH.joinpath('top'))
-    TOP.set_alpha(ALPHA)
+    DEFAULT: LazyAsset[Surface] = lazy_image(__PATH.joinpath('default'), alpha=ALPHA)
+    TOP: LazyAsset[Surface] = lazy_image(__PATH.joinpath('top'), alpha=ALPHA)
 
 
-class WebImages:
+class WebImages(LazyAssetsGroup):
 
-    LEFT: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('left_web'))
-    RIGHT: Surface = load_image(GameConfig.IMAGES_PATH.joinpath('right_web'))
+    LEFT: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('left_web'))
+    RIGHT: LazyAsset[Surface] = lazy_image(GameConfig.IMAGES_PATH.joinpath('right_web'))
@@ -0,0 +1,43 @@
+from enum import Enum
+from pathlib import Path
+
+from engine.music import MusicPlayer
+from game.config import GameConfig
+
+__all__ = (
+    'MusicTrack',
+    'play_music',
+    'stop_music',
+)
+
+
+class MusicTrack(Enum):
+    MAINSCREEN = 'mainscreen'
+    LEVEL = 'level'
+    LEVEL_ENDING = 'level_ending'
+
+
+# Сжатый формат предпочтительнее, 'wav' оставлен для совместимости со старыми файлами.
+_EXTENSIONS: tuple[str, ...] = ('ogg', 'wav')
+
+
+def find_music_path(track: MusicTrack) -> Path | None:
+    for extension in _EXTENSIONS:
+        path: Path = GameConfig.SOUNDS_PATH.joinpath(f'{track.value}.{extension}')
+        if path.exists():
+            return path
+    return None
+
+
+def play_music(track: MusicTrack) -> None:
+    # Уже играющая музыка не перезапускается.
+    path: Path | None = find_music_path(track)
+    if path is None:
+        # Без файла музыки сцена просто остаётся без неё.
+        stop_music()
+        return
+    MusicPlayer().play(path)
+
+
+def stop_music() -> None:
+    MusicPlayer().stop()
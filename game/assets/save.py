@@ -1,17 +1,75 @@
+from atexit import register as register_at_exit
+from math import inf
+from pathlib import Path
+from time import monotonic
+from typing import Callable, TypeAlias
+
 from engine.common.files import save_json, load_json
 from game.config import GameConfig
 
 __all__ = (
+    'SaveState',
+    'save_state',
     'get_coins_count',
     'set_coins_count',
 )
 
 FILE_PATH = GameConfig.ASSETS_PATH.joinpath('save.json')
 
+CoinsCountListenerType: TypeAlias = Callable[[int], None]
+
+
+class SaveState:
+    # Изменения чаще этого интервала копятся в памяти до следующей записи или выхода из игры.
+    _SAVE_DELAY: float = 2
+
+    def __init__(self, file_path: Path) -> None:
+        self._file_path = file_path
+        self._data: dict | None = None
+        self._is_dirty: bool = False
+        self._last_save_time: float = -inf
+        self._coins_count_listeners: list[CoinsCountListenerType] = []
+
+    @property
+    def coins_count(self) -> int:
+        return self._get_data()['coins_count']
+
+    def set_coins_count(self, count: int) -> None:
+        if count == self.coins_count:
+            return
+        self._get_data()['coins_count'] = count
+        for listener in self._coins_count_listeners:
+            listener(count)
+        self._is_dirty = True
+        self.save_if_it_need()
+
+    def add_coins_count_listener(self, listener: CoinsCountListenerType) -> None:
+        self._coins_count_listeners.append(listener)
+
+    def save_if_it_need(self) -> None:
+        if self._is_dirty and monotonic() - self._last_save_time >= self._SAVE_DELAY:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._is_dirty:
+            return
+        save_json(self._file_path, self._data)
+        self._is_dirty = False
+        self._last_save_time = monotonic()
+
+    def _get_data(self) -> dict:
+        if self._data is None:
+            self._data = load_json(self._file_path)
+        return self._data
+
+
+save_state: SaveState = SaveState(FILE_PATH)
+register_at_exit(save_state.flush)
+
 
 def get_coins_count() -> int:
-    return load_json(FILE_PATH)['coins_count']
+    return save_state.coins_count
 
 
 def set_coins_count(count: int) -> None:
-    return save_json(FILE_PATH, dict(coins_count=count))
+    save_state.set_coins_count(count)
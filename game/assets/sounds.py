@@ -1,12 +1,15 @@
-from pygame.mixer import init as init_mixer, Sound
+from functools import partial
 
+from pygame.mixer import Sound
+
+from engine.headless import is_headless
+from engine.lazy_assets import LazyAsset
+from engine.mixer import init_mixer_if_need
+from engine.null_sound import NullSound
+from engine.sound_effect import SoundEffect
 from game.config import GameConfig
 
 __all__ = (
-    'mainscreen_music',
-    'play_mainscreen_music',
-    'level_music',
-    'level_ending_music',
     'coin_sound',
     'heart_sound',
     'hit_sound',
@@ -15,24 +18,26 @@ __all__ = (
     'cannon_sound',
 )
 
-init_mixer()
-
 
-def load_sound(sound_name: str) -> Sound:
+def load_sound(sound_name: str) -> Sound | NullSound:
+    if is_headless():
+        return NullSound()
+    init_mixer_if_need()
     return Sound(GameConfig.SOUNDS_PATH.joinpath(sound_name + '.wav'))
 
 
-def play_mainscreen_music() -> None:
-    if mainscreen_music.get_num_channels() == 0:
-        mainscreen_music.play(-1)
+def load_sound_effect(sound_name: str, **kwargs) -> SoundEffect:
+    return SoundEffect(load_sound(sound_name), **kwargs)
+
+
+def lazy_sound(sound_name: str, **kwargs) -> LazyAsset[SoundEffect]:
+    return LazyAsset(partial(load_sound_effect, sound_name, **kwargs))
 
 
-mainscreen_music: Sound = load_sound('mainscreen')
-level_music: Sound = load_sound('level')
-level_ending_music: Sound = load_sound('level_ending')
-coin_sound: Sound = load_sound('coin')
-heart_sound: Sound = load_sound('heart')
-hit_sound: Sound = load_sound('hit')
-shield_sound: Sound = load_sound('shield')
-slug_sound: Sound = load_sound('slug')
-cannon_sound: Sound = load_sound('cannon')
+# Монеты из сундука и несколько пушек рядом не должны занимать все каналы.
+coin_sound: LazyAsset[SoundEffect] = lazy_sound('coin', max_voices=3, cooldown=0.05)
+heart_sound: LazyAsset[SoundEffect] = lazy_sound('heart')
+hit_sound: LazyAsset[SoundEffect] = lazy_sound('hit')
+shield_sound: LazyAsset[SoundEffect] = lazy_sound('shield')
+slug_sound: LazyAsset[SoundEffect] = lazy_sound('slug', max_voices=2)
+cannon_sound: LazyAsset[SoundEffect] = lazy_sound('cannon', max_voices=2, cooldown=0.1, max_distance=200)
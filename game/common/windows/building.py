@@ -4,6 +4,7 @@ from pygame.draw import rect as draw_rect
 
 from engine.common.colors import Color
 from engine.common.typing_ import ColorTupleType, SizeTupleType
+from engine.text_renderer import TextRenderer
 from game.assets.fonts import PixelFonts
 
 __all__ = (
@@ -21,11 +22,11 @@ class TextWindowPartBuilder:
                  text_color: ColorTupleType = Color.BLACK,
                  ) -> None:
         self._text = text
-        self._font = font
         self._w = w
         self._border_wh = border_wh
         self._inner_indent = inner_indent
         self._text_color = text_color
+        self._text_renderer: TextRenderer = TextRenderer.for_font(font)
 
     def new_text_surface(self, new_string_top_indent: int = 5) -> Surface:
         if '\n' in self._text:
@@ -35,7 +36,7 @@ class TextWindowPartBuilder:
             # Текстовые поверхности будем класть сюда:
             texts_surfaces: list[Surface] = []
             for i, text_part in enumerate(self._text.split('\n')):
-                txt_surf: Surface = self._font.render(text_part, 0, self._text_color)
+                txt_surf: Surface = self._text_renderer.render(text_part, self._text_color)
                 texts_surfaces.append(txt_surf)
                 h += txt_surf.get_height()
                 if i != 0:
@@ -51,7 +52,7 @@ class TextWindowPartBuilder:
                 y += txt_surf.get_height() + new_string_top_indent
             return result_surf
         else:
-            return self._font.render(self._text, 0, self._text_color)
+            return self._text_renderer.render(self._text, self._text_color)
 
     def calc_window_size(self, text_surface: Surface) -> SizeTupleType:
         w: int
@@ -95,9 +95,13 @@ class Button(AbstractTextWindow):
             self._hover_background_color,
         )
 
+    @property
+    def is_hovered(self) -> bool:
+        return bool(self._rect.collidepoint(mouse.get_pos()))
+
     def update(self) -> None:
         self._image = self._default_image
-        if self._rect.collidepoint(mouse.get_pos()):
+        if self.is_hovered:
             self._image = self._hover_image
 
             if mouse.get_pressed()[0] and not self._is_pressed_on_other_area:
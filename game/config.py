@@ -8,6 +8,10 @@ __all__ = (
 
 class GameConfig:
     MAX_FPS: float = 60
+    # Частота, под которую подобраны скорости объектов, и шаг симуляции при FIXED_TIMESTEP.
+    BASE_FPS: float = 60
+    # С фиксированным шагом прыжки и скорости одинаковы при любой частоте кадров.
+    FIXED_TIMESTEP: bool = True
 
     WINDOW_TITLE: str = 'Pixel'
     # От высоты зависит масштаб игры, моделей.
@@ -25,6 +29,12 @@ class GameConfig:
     # т.к. это облегчает работу и с '.py' и с '.exe'.
     ASSETS_PATH: Path = Path('../assets')
     LEVELS_PATH: Path = ASSETS_PATH.joinpath('levels')
+    # Создаётся автоматически из 'LEVELS_PATH'.
+    COMPILED_LEVELS_PATH: Path = ASSETS_PATH.joinpath('compiled_levels')
+    # Прохождение уровней хранится отдельно, файлы уровней только читаются.
+    PROGRESS_PATH: Path = ASSETS_PATH.joinpath('progress.json')
     IMAGES_PATH: Path = ASSETS_PATH.joinpath('images')
+    # Создаётся автоматически из 'IMAGES_PATH'.
+    ATLAS_PATH: Path = ASSETS_PATH.joinpath('atlas')
     SOUNDS_PATH: Path = ASSETS_PATH.joinpath('sounds')
     FONTS_PATH: Path = ASSETS_PATH.joinpath('fonts')
@@ -18,16 +18,20 @@ def start_game() -> None:
         h=GameConfig.WINDOW_HEIGHT,
         title=GameConfig.WINDOW_TITLE,
         flags=GameConfig.WINDOW_FLAGS,
-        icon=ICON_IMAGE,
+        icon=ICON_IMAGE.get(),
     )
 
     levels_manager: LevelsManager = LevelsManager(
         levels_folder_path=GameConfig.LEVELS_PATH,
+        compiled_levels_folder_path=GameConfig.COMPILED_LEVELS_PATH,
+        progress_file_path=GameConfig.PROGRESS_PATH,
     )
     initial_scene_key = SceneKey.HOME
 
     game: Game = Game(
         max_fps=GameConfig.MAX_FPS,
+        base_fps=GameConfig.BASE_FPS,
+        fixed_timestep=GameConfig.FIXED_TIMESTEP,
         scenes_manager=ScenesManager(
             initial_scene_key=initial_scene_key,
             levels_manager=levels_manager,
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from pygame import Rect
 
 from engine.common.float_rect import FloatRect
+from engine.fps import get_time_scale
 from engine.map_.abstract_map_object import AbstractMapObject as BaseAbstractMapObject
 from engine.map_.map_ import Map
 from engine.exceptions import MapObjectCannotBeCreated
@@ -28,11 +29,14 @@ class AbstractMapObject(BaseAbstractMapObject):
 class AbstractBlock(AbstractMapObject, ABC):
 
     _Z_INDEX = ZIndex.BLOCK
-    _GRID_ATTRS = [GridObjectAttr.BLOCK]
+    _GRID_ATTRS = GridObjectAttr.BLOCK
+    _IS_SOLID = True
+    _IS_STATIC = True
 
 
 class AbstractBackground(AbstractMapObject, ABC):
     _Z_INDEX = ZIndex.BACKGROUND
+    _IS_STATIC = True
 
 
 class AbstractInteractingWithPlayerMapObject(AbstractMapObject, ABC):
@@ -42,7 +46,7 @@ class AbstractInteractingWithPlayerMapObject(AbstractMapObject, ABC):
         super().update()
 
     def _handle_collision_with_player(self) -> None:
-        if self._rect.colliderect(self._map.player.get_rect()):
+        if self._map.is_near_player(self) and self._rect.colliderect(self._map.player.get_rect()):
             self._on_collision_with_player()
 
     @abstractmethod
@@ -84,11 +88,12 @@ class AbstractItemToDisposableCollect(AbstractInteractingWithPlayerMapObject, AB
 class AbstractMovingMapObject(AbstractMapObject, ABC):
 
     def update(self) -> None:
-        self._move()
+        self._move(get_time_scale())
+        self._relocate_in_grid()
         super().update()
 
     @abstractmethod
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         pass
 
 
@@ -98,7 +103,8 @@ class AbstractMovingAndInteractingWithPlayerMapObject(AbstractMovingMapObject,
     _Z_INDEX = ZIndex.MOVING_OBJECT
 
     def update(self) -> None:
-        self._move()
+        self._move(get_time_scale())
+        self._relocate_in_grid()
         AbstractInteractingWithPlayerMapObject.update(self)
 
 
@@ -121,10 +127,10 @@ class AbstractXPatrolEnemy(AbstractMovingAndInteractingWithPlayerMapObject, ABC)
         self._end_x = end_x
         self._x_vel: float = self._SPEED
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         if self._rect.left <= self._start_x or self._rect.right >= self._end_x:
             self._x_vel *= -1
-        self._rect.float_x += self._x_vel
+        self._rect.float_x += self._x_vel * time_scale
 
     def _on_collision_with_player(self) -> None:
         self._map.player.hit(
@@ -1,12 +1,12 @@
-from enum import IntEnum
+from enum import IntFlag
 
 __all__ = (
     'GridObjectAttr',
 )
 
 
-class GridObjectAttr(IntEnum):
+class GridObjectAttr(IntFlag):
 
-    BLOCK = 0
-    PLAYER = 1
-    SLUG = 2
+    BLOCK = 1
+    PLAYER = 2
+    SLUG = 4
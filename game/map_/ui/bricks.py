@@ -10,11 +10,12 @@ __all__ = (
 
 @Map.add_object_type
 class Bricks(AbstractBlock):
-    _image = BricksImages.DEFAULT
+    _IMAGES = BricksImages
 
     def __init__(self, map_: Map,
                  x: int, y: int,
                  ) -> None:
+        self._image = self._IMAGES.DEFAULT
         super().__init__(
             map_=map_,
             rect=self._image.get_rect(x=x, y=y),
@@ -23,11 +24,12 @@ class Bricks(AbstractBlock):
 
 @Map.add_object_type
 class BackgroundBricks(AbstractBackground):
-    _image = BricksImages.BACKGROUND
+    _IMAGES = BricksImages
 
     def __init__(self, map_: Map,
                  x: int, y: int,
                  ) -> None:
+        self._image = self._IMAGES.BACKGROUND
         super().__init__(
             map_=map_,
             rect=self._image.get_rect(x=x, y=y),
@@ -15,6 +15,7 @@ __all__ = (
 class Cannon(AbstractMapObject):
 
     _IMAGES = CannonImages
+    _SOUND = cannon_sound
     _ANIMATION_DELAY: float = 0.4
 
     def __init__(self, map_: Map,
@@ -55,7 +56,7 @@ class Cannon(AbstractMapObject):
     def _update_cannonballs(self) -> None:
         if self._shoot_frames_counter.current_index == self._shoot_frame_index:
             if not self._cannonball_was_spawned:
-                cannon_sound.play()
+                self._SOUND.play(source_rect=self._rect, listener_rect=self._map.camera.get_rect())
                 self._cannonballs.append(self._new_cannonball())
             self._cannonball_was_spawned = True
         else:
@@ -116,14 +117,14 @@ class Cannonball(AbstractMovingAndInteractingWithPlayerMapObject):
             if self._rect.left <= self._end_x:
                 self._death_frames_counter.start()
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         if self._death_frames_counter.is_end:
-            self._rect.float_x += self._current_speed * self._direction.value
-            self._decrease_speed()
+            self._rect.float_x += self._current_speed * self._direction.value * time_scale
+            self._decrease_speed(time_scale)
 
-    def _decrease_speed(self) -> None:
+    def _decrease_speed(self, time_scale: float) -> None:
         if self._current_speed > self._END_SPEED:
-            self._current_speed -= self._SPEED_DECREASE
+            self._current_speed -= self._SPEED_DECREASE * time_scale
 
     def _on_collision_with_player(self) -> None:
         self._map.player.hit(
@@ -132,6 +133,15 @@ class Cannonball(AbstractMovingAndInteractingWithPlayerMapObject):
         )
         self._death_frames_counter.start()
 
+    def _is_visible(self) -> bool:
+        # Ядра хранятся в пушке, а не в сетке.
+        return self._map.camera.get_rect().colliderect(self._rect.rect)
+
+    def _handle_collision_with_player(self) -> None:
+        # По той же причине окрестность игрока из сетки ядер не содержит.
+        if self._rect.colliderect(self._map.player.get_rect()):
+            self._on_collision_with_player()
+
     def _update_image(self) -> None:
         if not self._death_frames_counter.is_end:
             self._image = self._IMAGES.DEATH[self._death_frames_counter.current_index]
@@ -2,6 +2,7 @@ from engine.map_.map_ import Map
 from engine.common.counters import FramesCounter
 from engine.common.typing_ import XYTupleType
 from engine.common.float_rect import FloatRect
+from engine.fps import get_time_scale
 from game.assets.images import COIN_IMAGES
 from game.assets.sounds import coin_sound
 from game.map_.abstract_ui import AbstractItemToDisposableCollect
@@ -16,6 +17,7 @@ class Coin(AbstractItemToDisposableCollect):
 
     _Z_INDEX_WHEN_IS_TAKEN: int = 999
     _IMAGES = COIN_IMAGES
+    _SOUND = coin_sound
     _ANIMATION_DELAY: float = 0.15
 
     _collected_count: int = 0
@@ -78,12 +80,13 @@ class Coin(AbstractItemToDisposableCollect):
         if hypotenuse == 0:
             hypotenuse = 1
 
-        self._flying_rect.float_x += self._FLYING_SPEED * (x_dis / hypotenuse)
-        self._flying_rect.float_y -= self._FLYING_SPEED * (y_dis / hypotenuse)
+        speed: float = self._FLYING_SPEED * get_time_scale()
+        self._flying_rect.float_x += speed * (x_dis / hypotenuse)
+        self._flying_rect.float_y -= speed * (y_dis / hypotenuse)
         if self._flying_rect.x > self._flying_end_xy[0] and self._flying_rect.y < self._flying_end_xy[1]:
             self._to_delete = True
             type(self)._visual_collected_count += 1
-            coin_sound.play()
+            self._SOUND.play()
 
     def _on_collision_with_player(self) -> None:
         if not self._is_taken:
@@ -92,12 +95,17 @@ class Coin(AbstractItemToDisposableCollect):
     def take(self) -> None:
         super().take()
         self._z_index = self._Z_INDEX_WHEN_IS_TAKEN
+        self._update_z_index_in_grid()
         self._is_taken = True
         self._flying_rect = FloatRect(self._map.camera.apply_rect(self._rect))
         type(self)._collected_count += 1
 
+    def _is_visible(self) -> bool:
+        # Взятая монета летит в экранных координатах к счётчику.
+        return self._is_taken or super()._is_visible()
+
     def _draw(self) -> None:
         if not self._is_taken:
             super()._draw()
         else:
-            self._screen.blit(self._image, self._flying_rect)
+            self._screen.blit(self._image, self._flying_rect.rect)
@@ -17,10 +17,6 @@ class Dirt(AbstractBlock):
     _current_grass_index: int = 0
 
     _IMAGES = DirtImages
-    _EDGE_IMAGES: dict[Direction, Surface] = {
-        Direction.LEFT: _IMAGES.LEFT,
-        Direction.RIGHT: _IMAGES.RIGHT,
-    }
 
     def __init__(self, map_: Map,
                  x: int, y: int,
@@ -37,8 +33,10 @@ class Dirt(AbstractBlock):
 
     def _init_image(self) -> None:
         self._image: Surface
-        if self._direction is not None:
-            self._image = self._EDGE_IMAGES[self._direction].copy()
+        if self._direction == Direction.LEFT:
+            self._image = self._IMAGES.LEFT.copy()
+        elif self._direction == Direction.RIGHT:
+            self._image = self._IMAGES.RIGHT.copy()
         else:
             self._image = self._IMAGES.DEFAULT.copy()
 
@@ -59,9 +57,10 @@ class Dirt(AbstractBlock):
 
 @Map.add_object_type
 class BackgroundDirt(AbstractBackground):
-    _image = DirtImages.BACKGROUND
+    _IMAGES = DirtImages
 
     def __init__(self, map_: Map, x: int, y: int) -> None:
+        self._image = self._IMAGES.BACKGROUND
         super().__init__(
             map_=map_,
             rect=self._image.get_rect(x=x, y=y),
@@ -56,10 +56,10 @@ class Ghost(AbstractXPatrolEnemy):
                 self._x_vel = self._SPEED * self._direction_factor_backup
             self._is_in_attack_mode = False
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         self._set_x_vel_direction_regarding_player_pos()
-        super()._move()
-        self._do_y_deviation()
+        super()._move(time_scale)
+        self._do_y_deviation(time_scale)
 
     def _set_x_vel_direction_regarding_player_pos(self) -> None:
         if self._is_in_attack_mode:
@@ -68,8 +68,8 @@ class Ghost(AbstractXPatrolEnemy):
             else:
                 self._x_vel = -self._ATTACK_SPEED
 
-    def _do_y_deviation(self) -> None:
-        self._rect.float_y += self._current_y_deviation_vel
+    def _do_y_deviation(self, time_scale: float) -> None:
+        self._rect.float_y += self._current_y_deviation_vel * time_scale
         if self._rect.y <= self._y_at_top or self._rect.y >= self._y_at_bottom:
             self._current_y_deviation_vel *= -1
 
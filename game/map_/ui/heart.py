@@ -13,6 +13,7 @@ __all__ = (
 class Heart(AbstractInteractingWithPlayerMapObject):
 
     _IMAGES = HEART_IMAGES
+    _SOUND = heart_sound
     _ANIMATION_DELAY: float = 1
 
     def __init__(self, map_: Map,
@@ -35,4 +36,4 @@ class Heart(AbstractInteractingWithPlayerMapObject):
         if self._map.player.hp < self._map.player.max_hp:
             self._to_delete = True
             self._map.player.replenish_hp()
-            heart_sound.play()
+            self._SOUND.play()
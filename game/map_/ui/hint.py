@@ -1,3 +1,7 @@
+from math import ceil
+from pygame import Rect
+from pygame.font import Font
+
 from engine.map_.map_ import Map
 from engine.common.counters import FramesCounter
 from game.assets.images import HINT_IMAGES
@@ -40,25 +44,23 @@ class Hint(AbstractInteractingWithPlayerMapObject):
         )
 
         self._window_showing_enabled: bool = False
-        self._init_windows()
         self._window_showing_frames_counter: FramesCounter = FramesCounter(
-            frames_count=len(self._windows),
+            frames_count=ceil(len(self._text) / self._TEXT_SHOWING_STEP),
             transition_delay_as_seconds=self._WINDOW_SHOWING_ANIMATION_DELAY,
         )
+        # Окно создаётся один раз, когда игрок впервые дошёл до подсказки.
+        self._window: _HintTextWindow | None = None
 
-    def _init_windows(self) -> None:
-        self._windows: list[TextWindow] = []
-        current_text: str = ''
-        for i in range(0, len(self._text), self._TEXT_SHOWING_STEP):
-            current_text += self._text[i:i+self._TEXT_SHOWING_STEP]
-
-            window: _HintTextWindow = _HintTextWindow(
+    def _get_window(self) -> '_HintTextWindow':
+        if self._window is None:
+            self._window = _HintTextWindow(
                 map_=self._map,
                 x=self._x + self._rect.w,
                 y=self._y,
-                text=current_text,
+                text=self._text,
             )
-            self._windows.append(window)
+        self._window.reveal((self._window_showing_frames_counter.current_index + 1) * self._TEXT_SHOWING_STEP)
+        return self._window
 
     def update(self) -> None:
         self._window_showing_enabled = False
@@ -71,7 +73,7 @@ class Hint(AbstractInteractingWithPlayerMapObject):
     def _draw(self) -> None:
         super()._draw()
         if self._window_showing_enabled:
-            self._windows[self._window_showing_frames_counter.current_index].update()
+            self._get_window().update()
 
     def _on_collision_with_player(self) -> None:
         self._window_showing_enabled = True
@@ -81,20 +83,52 @@ class Hint(AbstractInteractingWithPlayerMapObject):
 
 class _HintTextWindow(TextWindow):
 
+    # Такой же отступ между строками использует 'TextWindowPartBuilder.new_text_surface'.
+    _NEW_STRING_TOP_INDENT: int = 5
+
     def __init__(self, map_: Map,
                  x: int, y: int,
                  text: str) -> None:
+        self._text = text
+        self._font: Font = PixelFonts.SMALL
         super().__init__(
             builder=TextWindowPartBuilder(
                 text=text,
-                font=PixelFonts.SMALL,
+                font=self._font,
             ),
             x=x, y=y,
         )
         self._map = map_
+        self._text_rect: Rect = self._builder.calc_text_center_rect(self._image, self._text_surface)
+        self._revealed_chars_count: int = 0
+        # Части текстовой поверхности, которые уже показаны: по одной на строку.
+        self._revealed_areas: list[Rect] = []
+
+    def _build_images(self) -> None:
+        # Текст целиком отрисован один раз, а в окне показывается только его открытая часть.
+        self._image = self._builder.new_background_surface(self._window_size, self._background_color)
+        self._image.blit(self._border_surface, (0, 0))
+
+    def reveal(self, chars_count: int) -> None:
+        if chars_count == self._revealed_chars_count:
+            return
+        self._revealed_chars_count = chars_count
+        self._revealed_areas.clear()
+        y: int = 0
+        line_h: int = self._font.get_height()
+        for line in self._text.split('\n'):
+            if chars_count <= 0:
+                break
+            self._revealed_areas.append(Rect(0, y, self._font.size(line[:chars_count])[0], line_h))
+            chars_count -= len(line) + 1
+            y += line_h + self._NEW_STRING_TOP_INDENT
 
     def _draw(self) -> None:
         rect_to_draw = self._map.camera.apply_rect(self._rect)
         if rect_to_draw.right > self._screen.get_width():
             rect_to_draw.right = self._screen.get_width()
         self._screen.blit(self._image, rect_to_draw)
+        text_x: int = rect_to_draw.x + self._text_rect.x
+        text_y: int = rect_to_draw.y + self._text_rect.y
+        for area in self._revealed_areas:
+            self._screen.blit(self._text_surface, (text_x + area.x, text_y + area.y), area)
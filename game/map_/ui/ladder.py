@@ -9,6 +9,7 @@ __all__ = (
 
 @Map.add_object_type
 class Ladder(AbstractInteractingWithPlayerMapObject):
+    _IS_MERGEABLE = True
     _image = LADDER_IMAGE
 
     def __init__(self, map_: Map,
@@ -12,7 +12,7 @@ from pygame import (
 )
 from pygame.key import get_pressed, ScancodeWrapper
 
-from engine.common.counters import FramesCounter, TimeCounter, calc_count_by_fps_from_seconds
+from engine.common.counters import FramesCounter, TimeCounter
 from engine.common.float_rect import FloatRect
 from engine.common.typing_ import AnyRectType
 from engine.map_.map_ import Map
@@ -20,8 +20,7 @@ from engine.map_.collision_checkable_mixin import CollisionCheckableMixin
 from engine.common.direction import Direction
 from game.assets.images import PlayerDefaultImages, PlayerDefaultWhiteImages
 from game.assets.sounds import hit_sound
-from game.map_.grid_attrs import GridObjectAttr
-from game.map_.abstract_ui import AbstractMovingMapObject, AbstractBlock
+from game.map_.abstract_ui import AbstractMovingMapObject
 from game.map_.z_indexes import ZIndex
 
 __all__ = (
@@ -35,6 +34,7 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
     _Z_INDEX = ZIndex.MOVING_OBJECT
     _DEFAULT_IMAGES = PlayerDefaultImages
     _WHITE_IMAGES = PlayerDefaultWhiteImages
+    _HIT_SOUND = hit_sound
 
     _BE_WHITE_DURATION: float = 0.25
     _GOD_MOD_DURATION: float = 1.2
@@ -67,7 +67,6 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
         )
         self._map.set_player(self)
 
-        self._be_white_count: float = calc_count_by_fps_from_seconds(self._BE_WHITE_DURATION)
         self._go_frames_counter: FramesCounter = FramesCounter(
             frames_count=len(self._DEFAULT_IMAGES.GO_RIGHT),
             transition_delay_as_seconds=self._GO_ANIMATION_DELAY,
@@ -89,7 +88,7 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
         self._in_water: bool = False
         self._hp: int = self._MAX_HP
         self._has_shield: bool = False
-        self._x_pushing: int = 0
+        self._x_pushing: float = 0
         self._x_vel: float = 0
         self._y_vel: float = 0
         self._direction: Direction = Direction.RIGHT
@@ -125,20 +124,22 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
         self._on_ladder = False
         self._in_water = False
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         self._set_on_ground_or_not()
-        self._update_x_vel()
-        self._update_y_vel()
-        self._update_rect_xy()
+        self._update_x_vel(time_scale)
+        self._update_y_vel(time_scale)
+        self._update_rect_xy(time_scale)
         self._kill_if_is_out_of_map()
+        # Объекты, которые обновляются после игрока, проверяют столкновение уже с его новым положением.
+        self._map.update_objects_near_player()
 
     def _set_on_ground_or_not(self) -> None:
         if abs(self._y_vel) >= self._ABSOLUTE_Y_VEL_TO_FALLING_DETECTION:
             self._on_ground = False
 
-    def _update_x_vel(self) -> None:
+    def _update_x_vel(self, time_scale: float) -> None:
         if self._x_pushing:
-            self._decrease_x_pushing()
+            self._decrease_x_pushing(time_scale)
             self._x_vel = self._x_pushing
         else:
             self._x_vel = 0
@@ -151,13 +152,13 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
             if self._on_ladder or self._in_water:
                 self._x_vel /= self._WATER_OR_LADDER_VEL_DECREASE_FACTOR
 
-    def _decrease_x_pushing(self) -> None:
+    def _decrease_x_pushing(self, time_scale: float) -> None:
         if self._x_pushing > 0:
-            self._x_pushing -= self._X_PUSHING_DECELERATION
+            self._x_pushing -= self._X_PUSHING_DECELERATION * time_scale
             if self._x_pushing < 0 or self._check_left_map_edge():
                 self._x_pushing = 0
         elif self._x_pushing < 0:
-            self._x_pushing += self._X_PUSHING_DECELERATION
+            self._x_pushing += self._X_PUSHING_DECELERATION * time_scale
             if self._x_pushing > 0 or self._check_right_map_edge():
                 self._x_pushing = 0
 
@@ -169,7 +170,7 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
         if self._rect.right >= self._map.levels_manager.current_level.w:
             self._rect.right = self._map.levels_manager.current_level.w
 
-    def _update_y_vel(self) -> None:
+    def _update_y_vel(self, time_scale: float) -> None:
         if self._on_ladder or self._in_water:
             self._y_vel = 0
             if self._is_pressed(self._GO_TOP_KEYS) or self._is_pressed(self._JUMP_KEYS):
@@ -181,25 +182,14 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
         else:
             if self._is_pressed(self._JUMP_KEYS) and self._on_ground:
                 self._y_vel = -self._JUMP_POWER
-            self._y_vel += self._GRAVITY
+            self._y_vel += self._GRAVITY * time_scale
 
-    def _update_rect_xy(self) -> None:
-        blocks: list[AbstractBlock] = self._map.grid.visible_by_attrs([GridObjectAttr.BLOCK])
-
-        self._rect.float_x += self._x_vel
-        self._handle_collision_with_blocks(blocks, self._x_vel, 0)
+    def _update_rect_xy(self, time_scale: float) -> None:
+        self._move_with_collisions(self._x_vel * time_scale, 0, self._map.collision_tilemap)
         self._check_left_map_edge()
         self._check_right_map_edge()
 
-        self._rect.float_y += self._y_vel
-        self._handle_collision_with_blocks(blocks, 0, self._y_vel)
-
-    def _handle_collision_with_blocks(self, blocks: list[AbstractBlock],
-                                      x_vel: float,
-                                      y_vel: float,
-                                      ) -> None:
-        for block in blocks:
-            self._handle_collision_with_bounding_rect(block.get_rect(), x_vel, y_vel)
+        self._move_with_collisions(0, self._y_vel * time_scale, self._map.collision_tilemap)
 
     def _handle_top_collision(self, bounding_rect: AnyRectType) -> None:
         super()._handle_top_collision(bounding_rect)
@@ -223,7 +213,7 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
                 self._has_shield = False
             else:
                 self._hp -= 1
-            hit_sound.play()
+            self._HIT_SOUND.play()
         if y_pushing is not None:
             self._y_vel = -y_pushing
         if x_pushing is not None and enemy_center_x is not None:
@@ -238,7 +228,7 @@ class Player(AbstractMovingMapObject, CollisionCheckableMixin):
             self._hp = self._MAX_HP
 
     def _update_image(self) -> None:
-        if self._god_mode_time_counter.delta() <= self._be_white_count:
+        if self._god_mode_time_counter.delta() <= self._BE_WHITE_DURATION:
             images = self._WHITE_IMAGES
         else:
             images = self._DEFAULT_IMAGES
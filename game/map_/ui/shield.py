@@ -13,6 +13,7 @@ __all__ = (
 class Shield(AbstractInteractingWithPlayerMapObject):
 
     _IMAGES = SHIELD_IMAGES
+    _SOUND = shield_sound
     _ANIMATION_DELAY: float = 0.1
 
     def __init__(self, map_: Map,
@@ -36,4 +37,4 @@ class Shield(AbstractInteractingWithPlayerMapObject):
         if not self._map.player.has_shield:
             self._to_delete = True
             self._map.player.add_shield()
-            shield_sound.play()
+            self._SOUND.play()
@@ -49,12 +49,12 @@ class Skeleton(AbstractXPatrolEnemy):
             transition_delay_as_seconds=self._ANIMATION_DELAY,
         )
 
-        self._anim_rect: Rect = self._rect
+        self._anim_rect: Rect = self._rect.rect
         self.attack_direction: Direction | None = None
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         if self._attack_frames_counter.is_end:
-            super()._move()
+            super()._move(time_scale)
 
     def _on_collision_with_player(self) -> None:
         if self._attack_frames_counter.current_index == self._ATTACK_FRAME_INDEX:
@@ -68,7 +68,7 @@ class Skeleton(AbstractXPatrolEnemy):
 
     def _update_image(self) -> None:
         if self._attack_frames_counter.is_end:
-            self._anim_rect = self._rect
+            self._anim_rect = self._rect.rect
             if self._x_vel < 0:
                 self._image = self._IMAGES.GO_LEFT[self._go_frames_counter.current_index]
             elif self._x_vel > 0:
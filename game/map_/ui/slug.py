@@ -17,6 +17,7 @@ class Slug(AbstractXPatrolEnemy):
 
     _SPEED = 0.6
     _IMAGES = SlugImages
+    _SOUND = slug_sound
     _ANIMATION_DELAY: float = 0.1
 
     _PLAYER_Y_VEL_FOR_DEATH: float = 8
@@ -43,18 +44,18 @@ class Slug(AbstractXPatrolEnemy):
             transition_delay_as_seconds=self._ANIMATION_DELAY,
         )
 
-        self._anim_rect: Rect = self._rect
+        self._anim_rect: Rect = self._rect.rect
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         if self._death_frames_counter.is_end:
-            super()._move()
+            super()._move(time_scale)
 
     def _on_collision_with_player(self) -> None:
         if self._map.player.y_vel >= self._PLAYER_Y_VEL_FOR_DEATH:
             if not self._map.player.in_god_mode():
                 self._map.player.jump_from_slug(-self._Y_PUSHING_POWER_AFTER_DEATH)
                 self._death_frames_counter.start()
-                slug_sound.play()
+                self._SOUND.play()
         elif self._death_frames_counter.is_end:
             super()._on_collision_with_player()
 
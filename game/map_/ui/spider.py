@@ -41,14 +41,14 @@ class Spider(AbstractMovingAndInteractingWithPlayerMapObject):
         self._y_vel: float = 0
         self._reaction_rect: Rect = Rect(self._rect.x, self._start_y, self._rect.w, self._end_y - self._start_y)
 
-    def _move(self) -> None:
+    def _move(self, time_scale: float) -> None:
         self._y_vel = 0
         if self._reaction_rect.colliderect(self._map.player.get_rect()):
             if self._rect.bottom <= self._map.player._rect.y:
                 self._y_vel = self._SPEED
         elif self._rect.y > self._start_y:
             self._y_vel = -self._SPEED
-        self._rect.float_y += self._y_vel
+        self._rect.float_y += self._y_vel * time_scale
 
     def _on_collision_with_player(self) -> None:
         self._map.player.hit()
@@ -12,6 +12,7 @@ __all__ = (
 class Water(AbstractInteractingWithPlayerMapObject):
 
     _Z_INDEX = ZIndex.OVERLAY
+    _IS_MERGEABLE = True
     _IMAGES = WaterImages
 
     def __init__(self, map_: Map,
@@ -6,7 +6,7 @@ from engine.abstract_ui import AbstractRectangularUI
 from engine.scenes.abstract_scene import AbstractScene
 from engine.scenes.manager import ScenesManager
 from game.assets.images import BackgroundImages
-from game.assets.sounds import level_ending_music
+from game.assets.music import MusicTrack, play_music, stop_music
 from game.scenes.keys import SceneKey
 
 __all__ = (
@@ -41,10 +41,10 @@ class AbstractLevelEndingScene(AbstractLevelOverlayScene, ABC):
 
     def on_open(self) -> None:
         super().on_open()
-        level_ending_music.play(-1)
+        play_music(MusicTrack.LEVEL_ENDING)
 
     def on_close(self) -> None:
-        level_ending_music.stop()
+        stop_music()
 
 
 class HomeBackground(AbstractRectangularUI):
@@ -3,7 +3,7 @@ from engine.common.typing_ import XYTupleType
 from engine.scenes.manager import ScenesManager
 from engine.scenes.abstract_scene import AbstractScene
 from engine.exceptions import ExitFromGame
-from game.assets.sounds import play_mainscreen_music
+from game.assets.music import MusicTrack, play_music
 from game.assets.fonts import PixelFonts
 from game.common.windows.building import TextWindowPartBuilder
 from game.common.windows.windows import TextWindow, Button
@@ -64,7 +64,7 @@ class HomeScene(AbstractScene):
         raise ExitFromGame
 
     def on_open(self) -> None:
-        play_mainscreen_music()
+        play_music(MusicTrack.MAINSCREEN)
 
     def update(self) -> None:
         super().update()
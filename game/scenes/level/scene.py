@@ -4,13 +4,16 @@ from pygame.event import Event
 from engine.common.colors import Color
 from engine.common.typing_ import XYTupleType
 from engine.exceptions import PlayerWasNotCreated
+from engine.lazy_assets import LazyAsset, collect_lazy_assets
+from engine.levels.level import Level
 from engine.map_.camera import Camera
 from engine.map_.grid.grid import Grid
+from engine.map_.collision_tilemap import CollisionTilemap
 from engine.scenes.abstract_scene import AbstractScene
 from engine.scenes.manager import ScenesManager
 from game.assets.images import SUN_IMAGE
-from game.assets.sounds import level_music
-from game.assets.save import get_coins_count, set_coins_count
+from game.assets.music import MusicTrack, play_music, stop_music
+from game.assets.save import get_coins_count, set_coins_count, save_state
 from game.map_ import Map
 from game.map_.ui.coin import Coin
 from game.map_.abstract_ui import AbstractItemToDisposableCollect
@@ -21,6 +24,7 @@ from game.scenes.level.ui import (
     CloudManager,
     CoinCounterHUD,
     PlayerHPHUD,
+    collect_ui_assets,
 )
 
 __all__ = (
@@ -34,26 +38,51 @@ class LevelScene(AbstractScene):
     _SCENE_KEY_TO_SWITCH_ON_PLAYER_WAS_NOT_CREATED_EXCEPTION: SceneKey = SceneKey.LEVELS_MENU
     _BACKGROUND_COLOR: Color = Color.BLUE
     _SUN_XY: XYTupleType = (50, 50)
+    _BLOCK_SIZE: int = 40
+    _GRID_CELL_SIDE_LEN: int = _BLOCK_SIZE * 4
+    _GRID_VISIBLE_AREA_MARGIN: int = _BLOCK_SIZE * 2
+    _GRID_SIMULATED_AREA_MARGIN: int = _BLOCK_SIZE * 12
+    _SUN_IMAGE = SUN_IMAGE
     _saved_screen: Surface
 
     def __init__(self, scenes_manager: ScenesManager) -> None:
         super().__init__(scenes_manager=scenes_manager)
         self._camera = Camera()
-        self._grid = Grid(camera=self._camera)
+        self._grid = Grid(
+            camera=self._camera,
+            cell_side_len=self._GRID_CELL_SIDE_LEN,
+            visible_area_margin=self._GRID_VISIBLE_AREA_MARGIN,
+            simulated_area_margin=self._GRID_SIMULATED_AREA_MARGIN,
+        )
+        self._collision_tilemap = CollisionTilemap(tile_side_len=self._BLOCK_SIZE)
         self._map = Map(
             camera=self._camera,
             grid=self._grid,
+            collision_tilemap=self._collision_tilemap,
             levels_manager=self._scenes_manager.levels_manager,
         )
 
-        self._background: Background = Background(camera=self._camera)
+        # Интерфейс создаётся при первом запуске уровня, чтобы его изображения не загружались при старте игры.
+        self._background: Background | None = None
         self._clouds: CloudManager = CloudManager()
-        self._coins_counter_hud: CoinCounterHUD = CoinCounterHUD()
-        self._player_hp_hud: PlayerHPHUD = PlayerHPHUD(map_=self._map)
+        self._coins_counter_hud: CoinCounterHUD | None = None
+        self._player_hp_hud: PlayerHPHUD | None = None
 
         self._need_to_save_screen_and_switch_to: SceneKey | None = None
 
+    @classmethod
+    def collect_assets(cls, level: Level) -> list[LazyAsset]:
+        return [*collect_lazy_assets(cls), *collect_ui_assets(), *Map.collect_level_assets(level)]
+
+    def _init_ui_if_need(self) -> None:
+        if self._background is not None:
+            return
+        self._background = Background(camera=self._camera)
+        self._coins_counter_hud = CoinCounterHUD()
+        self._player_hp_hud = PlayerHPHUD(map_=self._map)
+
     def reset(self) -> None:
+        self._init_ui_if_need()
         try:
             self._map.reset()
         except PlayerWasNotCreated:
@@ -63,15 +92,16 @@ class LevelScene(AbstractScene):
 
     def _on_player_was_not_created_exception(self) -> None:
         print('Уровень не может быть запущен, поскольку не выставлена позиция игрока!')
-        level_music.stop()
+        stop_music()
         self._scenes_manager.switch_to(self._SCENE_KEY_TO_SWITCH_ON_PLAYER_WAS_NOT_CREATED_EXCEPTION)
 
     def on_open(self) -> None:
         self._need_to_save_screen_and_switch_to = False
-        level_music.play(-1)
+        play_music(MusicTrack.LEVEL)
 
     def on_close(self) -> None:
-        level_music.stop()
+        stop_music()
+        save_state.flush()
 
     def _handle_event(self, event: Event) -> None:
         if event.type == KEYDOWN:
@@ -82,7 +112,7 @@ class LevelScene(AbstractScene):
         super().update()
 
         self._screen.fill(self._BACKGROUND_COLOR)
-        self._screen.blit(SUN_IMAGE, self._SUN_XY)
+        self._screen.blit(self._SUN_IMAGE, self._SUN_XY)
 
         self._clouds.update()
         self._background.update()
@@ -92,6 +122,8 @@ class LevelScene(AbstractScene):
         self._save_screen_and_switch_if_it_need()
         self._player_hp_hud.update()
         self._coins_counter_hud.update()
+        # Изменение, отложенное из-за частых сохранений, записывается не позже чем через '_SAVE_DELAY'.
+        save_state.save_if_it_need()
 
     def _check_player_hp(self) -> None:
         if self._map.player.hp <= 0:
@@ -101,6 +133,7 @@ class LevelScene(AbstractScene):
         if self._map.is_completed:
             self._save_coins()
             self._save_collected_ids()
+            save_state.flush()
             self._need_to_save_screen_and_switch_to = SceneKey.LEVEL_COMPLETION
 
     @staticmethod
@@ -122,3 +155,7 @@ class LevelScene(AbstractScene):
     @property
     def saved_screen(self) -> Surface:
         return self._saved_screen
+
+    @property
+    def map_(self) -> Map:
+        return self._map
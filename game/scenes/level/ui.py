@@ -5,7 +5,10 @@ from pygame import Surface, SRCALPHA
 from engine.abstract_ui import AbstractNoSizeUI
 from engine.map_.camera import Camera
 from engine.common.counters import TimeCounter
+from engine.fps import get_time_scale
 from engine.common.colors import Color
+from engine.lazy_assets import LazyAsset, collect_lazy_assets
+from engine.text_renderer import TextRenderer
 from game.assets.fonts import PixelFonts
 from game.assets.images import (
     BackgroundImages,
@@ -15,7 +18,7 @@ from game.assets.images import (
     LOST_HEART_IMAGE,
     SHIELD_IMAGES,
 )
-from game.assets.save import get_coins_count
+from game.assets.save import save_state
 from game.map_.ui.coin import Coin
 from game.map_.ui.player import Player
 from game.map_ import Map
@@ -25,15 +28,21 @@ __all__ = (
     'CloudManager',
     'CoinCounterHUD',
     'PlayerHPHUD',
+    'collect_ui_assets',
 )
 
 
+def collect_ui_assets() -> list[LazyAsset]:
+    return collect_lazy_assets(Background, Cloud, _Coin, PlayerHPHUD)
+
+
 class Background(AbstractNoSizeUI):
 
-    _image = BackgroundImages.MAP
+    _IMAGES = BackgroundImages
     _SMOOTH: float = 0.03
 
     def __init__(self, camera: Camera) -> None:
+        self._image = self._IMAGES.MAP
         super().__init__(y=self._screen.get_height() - self._image.get_height())
         self._camera = camera
         self._float_x: float = 0
@@ -115,7 +124,7 @@ class Cloud(AbstractNoSizeUI):
         return cloud
 
     def update(self) -> None:
-        self._float_x += self._x_vel
+        self._float_x += self._x_vel * get_time_scale()
         self._x = int(self._float_x)
         if self._float_x > self._x_to_delete:
             self._to_delete = True
@@ -134,9 +143,10 @@ class CoinCounterHUD:
 
 
 class _Coin(AbstractNoSizeUI):
-    _image = COIN_IMAGES[0]
+    _IMAGES = COIN_IMAGES
 
     def __init__(self) -> None:
+        self._image = self._IMAGES[0]
         super().__init__(x=self._screen.get_width() - self._image.get_width(), y=0)
 
 
@@ -146,38 +156,44 @@ class _Count(AbstractNoSizeUI):
         super().__init__()
         self._base_x = base_x
         self._count: int = -999
+        # Баланс читается из файла один раз, дальше приходят только изменения.
+        self._saved_count: int = save_state.coins_count
+        save_state.add_coins_count_listener(self._on_saved_count_change)
+
+    def _on_saved_count_change(self, saved_count: int) -> None:
+        self._saved_count = saved_count
 
     def update(self) -> None:
         self._update_image()
         super().update()
 
     def _update_image(self) -> None:
-        current_count: int = get_coins_count() + cast(int, Coin.visual_collected_count)
+        current_count: int = self._saved_count + cast(int, Coin.visual_collected_count)
         if current_count == self._count:
             return
 
-        self._image = PixelFonts.SMALL.render(
-            str(current_count), 0,
-            Color.WHITE,
-        )
+        self._count = current_count
+        self._image = TextRenderer.for_font(PixelFonts.SMALL).render(str(current_count), Color.WHITE)
         self._x = self._base_x - self._image.get_width()
 
 
 class PlayerHPHUD(AbstractNoSizeUI):
 
-    _HEART_IMAGE = HEART_IMAGES[0]
+    _HEART_IMAGES = HEART_IMAGES
     _LOST_HEART_IMAGE = LOST_HEART_IMAGE
-    _SHIELD_IMAGE = SHIELD_IMAGES[-2]
-    _HEART_W: int = _HEART_IMAGE.get_width()
+    _SHIELD_IMAGES = SHIELD_IMAGES
 
     def __init__(self, map_: Map) -> None:
         super().__init__()
         self._map = map_
+        self._heart_image: Surface = self._HEART_IMAGES[0]
+        self._shield_image: Surface = self._SHIELD_IMAGES[-2]
+        self._heart_w: int = self._heart_image.get_width()
 
         self._hp: int = -999
         self._has_shield: bool | None = None
-        self._w: int = cast(int, Player.max_hp) * self._HEART_W + self._SHIELD_IMAGE.get_width()
-        self._h: int = self._HEART_IMAGE.get_height()
+        self._w: int = cast(int, Player.max_hp) * self._heart_w + self._shield_image.get_width()
+        self._h: int = self._heart_image.get_height()
 
     def update(self) -> None:
         self._update_image()
@@ -193,10 +209,10 @@ class PlayerHPHUD(AbstractNoSizeUI):
         cur_x: int = 0
         for i in range(self._map.player.max_hp):
             if i + 1 <= self._map.player.hp:
-                self._image.blit(self._HEART_IMAGE, (cur_x, 0))
+                self._image.blit(self._heart_image, (cur_x, 0))
             else:
                 self._image.blit(self._LOST_HEART_IMAGE, (cur_x, 0))
-            cur_x += self._HEART_W
+            cur_x += self._heart_w
 
         if self._map.player.has_shield:
-            self._image.blit(self._SHIELD_IMAGE, (cur_x, 0))
+            self._image.blit(self._shield_image, (cur_x, 0))
@@ -4,15 +4,18 @@ from typing import Callable
 from engine.common.counters import TimeCounter
 from engine.common.typing_ import XYTupleType, ColorTupleType
 from engine.common.colors import Color
+from engine.lazy_assets import AssetsPreloader
+from engine.levels.level import Level
 from engine.scenes.manager import ScenesManager
 from engine.scenes.abstract_scene import AbstractScene
-from game.assets.sounds import play_mainscreen_music, mainscreen_music
+from game.assets.music import MusicTrack, play_music
 from game.assets.fonts import PixelFonts
 from game.common.windows.building import TextWindowPartBuilder
 from game.common.windows.windows import Button, TextWindow
 from game.common.windows.rect_relative_position_names import RectRelativePositionName
 from game.scenes.keys import SceneKey
 from game.scenes.common import HomeBackground
+from game.scenes.level.scene import LevelScene
 
 __all__ = (
     'LevelsMenuScene',
@@ -53,6 +56,12 @@ class LevelsMenuScene(AbstractScene):
         self._not_available_level_message_counter = TimeCounter(5)
 
         self._levels_buttons: list[Button] = []
+        self._available_levels_by_buttons: dict[Button, Level] = {}
+        # Пока открыто меню, в фоне читаются объекты выбранного уровня (под курсором, иначе текущего),
+        # а затем понемногу загружаются ресурсы его типов объектов.
+        self._assets_preloader: AssetsPreloader = AssetsPreloader()
+        self._level_to_preload: Level | None = None
+        self._level_assets_are_queued: bool = False
 
     def _back_button_on_click(self) -> None:
         self._scenes_manager.switch_to(SceneKey.HOME)
@@ -60,10 +69,34 @@ class LevelsMenuScene(AbstractScene):
     def on_open(self) -> None:
         self._reset_levels_buttons()
         self._not_available_level_message_counter.stop()
-        play_mainscreen_music()
+        play_music(MusicTrack.MAINSCREEN)
+        self._level_to_preload = None
+        self._select_level_to_preload(self._scenes_manager.levels_manager.current_level_by_list())
+
+    def _select_level_to_preload(self, level: Level) -> None:
+        if level is self._level_to_preload:
+            return
+        self._level_to_preload = level
+        self._level_assets_are_queued = False
+        self._assets_preloader.clear()
+        self._scenes_manager.levels_manager.prefetch(level.index)
+
+    def _preload_hovered_level(self) -> None:
+        for button, level in self._available_levels_by_buttons.items():
+            if button.is_hovered:
+                self._select_level_to_preload(level)
+                return
+
+    def _queue_level_assets_if_need(self) -> None:
+        # Нужные ресурсы зависят от типов объектов уровня, поэтому собираются, когда объекты уже прочитаны.
+        if self._level_assets_are_queued or not self._level_to_preload.objects_are_loaded:
+            return
+        self._assets_preloader.add(LevelScene.collect_assets(self._level_to_preload))
+        self._level_assets_are_queued = True
 
     def _reset_levels_buttons(self) -> None:
         self._levels_buttons.clear()
+        self._available_levels_by_buttons.clear()
 
         x: int = self._SCREEN_BORDER_INDENT
         for i, level in enumerate(self._scenes_manager.levels_manager.levels):
@@ -76,6 +109,8 @@ class LevelsMenuScene(AbstractScene):
 
             button = button_factory(text=str(level.index), level_index=level.index, x=x)
             self._levels_buttons.append(button)
+            if level.is_available:
+                self._available_levels_by_buttons[button] = level
 
             x = button.get_rect().right + 10
 
@@ -103,7 +138,6 @@ class LevelsMenuScene(AbstractScene):
     def _available_level_button_on_click(self, level_index: int) -> None:
         self._scenes_manager.levels_manager.switch_to(level_index)
         self._scenes_manager.switch_to(SceneKey.LEVEL).reset()
-        mainscreen_music.stop()
 
     def _new_not_available_level_button(self, text: str,
                                         level_index: int,  # noqa
@@ -142,6 +176,9 @@ class LevelsMenuScene(AbstractScene):
 
     def update(self) -> None:
         super().update()
+        self._preload_hovered_level()
+        self._queue_level_assets_if_need()
+        self._assets_preloader.update()
         self._background.update()
         self._back_button.update()
 